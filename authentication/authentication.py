@@ -1,6 +1,14 @@
+import jwt
+import time
+
 from django.contrib.auth.models import User
 from common_app.models import User, OAuthAccessToken
 from django.contrib.auth.backends import BaseBackend
+from django.utils.functional import SimpleLazyObject
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from utils.token_cache import cache_token, get_cached_token, evict_token
+from utils.jwt_tokens import decode_access_token, looks_like_jwt
 
 class OAuthBackend(BaseBackend):
     """
@@ -12,16 +20,18 @@ class OAuthBackend(BaseBackend):
 
     """
 
-    def authenticate(email, password):
+    def authenticate(self, request, email=None, password=None):
         """
         Authenticates a user using their email and password.
 
         This method performs the following steps:
         - Fetches the user with the given email.
-        - Validates the provided password against the user's stored password.
+        - Validates the provided password against the user's stored password on the 
+            password hashing pool, re-hashing it if the hasher parameters changed.
         - Returns the user object if authentication is successful.
 
         Args:
+            request (HttpRequest): The current request, or None.
             email (str, optional): The email address of the user trying to authenticate.
             password (str, optional): The password of the user trying to authenticate.
 
@@ -65,6 +75,116 @@ class OAuthBackend(BaseBackend):
             return User.objects.get(id=user_id)
         except User.DoesNotExist:
             return None
-        
 
-        
\ No newline at end of file
+
+
+class BearerTokenAuthentication(BaseAuthentication):
+    """
+    DRF authentication class validating `Authorization: Bearer <token>` headers
+    against `OAuthAccessToken`.
+
+    Token lookups are served from a Redis cache (token -> user, role, expiry)
+    whose TTL matches the token expiry, so a steady-state authenticated request
+    does not query the database. Signed (JWT) access tokens are verified locally
+    and need neither a database nor a Redis lookup. The user object is resolved
+    lazily and only hits the database if a view actually uses `request.user`.
+
+    Requests without an `Authorization` header are left unauthenticated.
+    """
+
+    keyword = 'bearer'
+
+    def authenticate(self, request):
+        """
+        Authenticates the request from its bearer token.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            tuple or None:
+                - (user, token_details) if a valid bearer token is provided.
+                - None if the request does not carry a bearer token.
+
+        Raises:
+            AuthenticationFailed: If the token is malformed, unknown or expired.
+        """
+        auth_header = get_authorization_header(request).split()
+
+        if not auth_header or auth_header[0].lower() != self.keyword.encode():
+            return None
+
+        if len(auth_header) != 2:
+            raise exceptions.AuthenticationFailed('Invalid or missing token.')
+
+        try:
+            access_token = auth_header[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed('Invalid or missing token.')
+
+        if looks_like_jwt(access_token):
+            token_details = self._decode_jwt(access_token)
+        else:
+            token_details = get_cached_token(access_token) or self._load_token(access_token)
+
+        if token_details['expires_at'] < time.time():
+            evict_token(access_token)
+            raise exceptions.AuthenticationFailed('Token has expired.')
+
+        user_id = token_details['user_id']
+        user = SimpleLazyObject(lambda: User.objects.select_related('role_id').filter(id=user_id).first())
+        return user, token_details
+
+
+    def _decode_jwt(self, access_token: str) -> dict:
+        """
+        Verifies a signed access token and returns the identity it carries.
+        """
+        try:
+            claims = decode_access_token(access_token)
+        except jwt.ExpiredSignatureError:
+            raise exceptions.AuthenticationFailed('Token has expired.')
+        except jwt.InvalidTokenError:
+            raise exceptions.AuthenticationFailed('Invalid or missing token.')
+
+        return {
+            'user_id': claims['sub'],
+            'role_id': claims.get('role_id'),
+            'role': claims.get('role'),
+            'permission_mask': claims.get('perm', 0),
+            'expires_at': claims['exp'],
+        }
+
+
+    def _load_token(self, access_token: str) -> dict:
+        """
+        Reads an opaque token from the database and stores it in the token cache.
+
+        Records issued in JWT mode store a token ID instead of a bearer token and
+        are excluded by their token type.
+        """
+        token = OAuthAccessToken.objects.select_related('user__role_id').filter(
+            access_token=access_token, token_type='Bearer'
+        ).first()
+
+        if not token:
+            raise exceptions.AuthenticationFailed('Invalid or missing token.')
+
+        cache_token(
+            access_token=access_token,
+            user_id=token.user_id,
+            role_id=token.user.role_id_id,
+            role=token.user.role_id.name,
+            expires_at=token.expires_at
+        )
+
+        return {
+            'user_id': str(token.user_id),
+            'role_id': str(token.user.role_id_id),
+            'role': token.user.role_id.name,
+            'expires_at': token.expires_at.timestamp(),
+        }
+
+
+    def authenticate_header(self, request):
+        return 'Bearer'
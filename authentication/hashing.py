@@ -0,0 +1,119 @@
+import threading
+
+from django.conf import settings
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth import hashers
+
+
+class PasswordHashingBusy(Exception):
+    """
+    Raised when the password hashing pool is saturated and a request could not
+    get a slot within `PASSWORD_HASH_QUEUE_TIMEOUT` seconds.
+    """
+
+
+
+class ConfigurablePBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 hasher whose iteration count comes from `PASSWORD_HASH_ITERATIONS`.
+
+    It keeps the `pbkdf2_sha256` algorithm name, so existing hashes stay valid;
+    when the configured iterations change, `must_update` flags stored hashes and
+    they are transparently re-hashed on the next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS
+
+
+
+# PBKDF2 runs inside OpenSSL with the GIL released, so a thread pool sized to the
+# CPU count gives real parallelism while keeping request threads from piling up
+# on CPU-bound hashing. The semaphore bounds running + queued jobs (backpressure).
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix='password-hash'
+)
+_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE)
+
+# Batches (e.g. bulk user provisioning) share a smaller allowance of those slots,
+# so an import can never take every worker and queue slot away from logins.
+_batch_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_BATCH_SLOTS)
+
+
+def _submit(func, *args):
+    """
+    Schedules `func` on the hashing pool once a slot is free.
+
+    Raises:
+        PasswordHashingBusy: If no pool slot frees up within the queue timeout.
+    """
+    if not _slots.acquire(timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT):
+        raise PasswordHashingBusy('Password hashing is saturated, try again later.')
+
+    try:
+        future = _executor.submit(func, *args)
+    except Exception:
+        _slots.release()
+        raise
+
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+
+def _run(func, *args):
+    """
+    Runs `func` on the hashing pool and waits for its result.
+    """
+    return _submit(func, *args).result()
+
+
+def hash_password(raw_password: str) -> str:
+    """
+    Hashes a raw password on the hashing pool with the preferred hasher.
+    """
+    return _run(hashers.make_password, raw_password)
+
+
+def hash_passwords(raw_passwords: list) -> list:
+    """
+    Hashes many raw passwords in parallel on the hashing pool, in order.
+
+    At most `PASSWORD_HASH_BATCH_SLOTS` jobs of all batches are in the pool at
+    once; further jobs wait for one of them to finish, then go through the same
+    backpressure as single hashes.
+
+    Raises:
+        PasswordHashingBusy: If the pool stays saturated by other requests.
+    """
+    futures = []
+
+    for raw_password in raw_passwords:
+        _batch_slots.acquire()
+
+        try:
+            future = _submit(hashers.make_password, raw_password)
+        except Exception:
+            _batch_slots.release()
+            raise
+
+        future.add_done_callback(lambda _: _batch_slots.release())
+        futures.append(future)
+
+    return [future.result() for future in futures]
+
+
+def verify_password(raw_password: str, encoded: str):
+    """
+    Verifies a raw password against a stored hash on the hashing pool.
+
+    Returns:
+        tuple:
+            - (bool): True if the password matches.
+            - (bool): True if the stored hash was made with outdated hasher
+                parameters and should be replaced.
+    """
+    needs_rehash = []
+    is_correct = _run(hashers.check_password, raw_password, encoded, needs_rehash.append)
+    return is_correct, bool(needs_rehash)
@@ -0,0 +1,139 @@
+import jwt
+import uuid
+import hashlib
+
+from django.conf import settings
+from common_app.models import User
+from django.utils.functional import SimpleLazyObject
+from rest_framework.authentication import get_authorization_header
+from utils.utils import create_response, get_client_ip
+from utils.rate_limit import take_token
+from utils.token_cache import token_cache_key
+from utils.jwt_tokens import decode_access_token, looks_like_jwt
+
+
+# URL keyword arguments naming the acting user, in order of precedence.
+PRINCIPAL_URL_KWARGS = ('granted_by', 'user_id')
+
+
+def resolve_principal(user_id: uuid.UUID):
+    """
+    Fetches the acting user together with their role in a single query.
+
+    Args:
+        user_id (uuid.UUID): The ID of the acting user, or None.
+
+    Returns:
+        User or None: The user with `role_id` already joined, or None if not found.
+    """
+    if user_id is None:
+        return None
+
+    return User.objects.select_related('role_id').filter(id=user_id).first()
+
+
+class PrincipalMiddleware:
+    """
+    Resolves the acting user once per request and memoizes it on `request.principal`.
+
+    The acting user is taken from the view's URL keyword arguments (see
+    `PRINCIPAL_URL_KWARGS`). Resolution is lazy, so endpoints that never touch
+    `request.principal` do not pay for the query, and the role is loaded with
+    `select_related` so role checks afterwards are free.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        principal_id = next(
+            (view_kwargs[name] for name in PRINCIPAL_URL_KWARGS if view_kwargs.get(name)),
+            None
+        )
+
+        request.principal_id = principal_id
+        request.principal = SimpleLazyObject(lambda: resolve_principal(principal_id))
+        return None
+
+
+
+class RateLimitMiddleware:
+    """
+    Applies token-bucket rate limits per view class and per client.
+
+    Limits are configured in `settings.API_RATE_LIMITS` as
+    `{view class name: (tokens per second, burst)}`; other views are not limited.
+    Each request costs exactly one Redis script call, which also does the only
+    lookup needed to identify the client:
+    - signed (JWT) bearer tokens by the user ID they carry, once the signature is verified,
+    - opaque bearer tokens by a digest of the token, but only while the token is
+      in the token cache (the script checks its key); unknown tokens share the
+      client IP's bucket, so random tokens cannot bypass the limit,
+    - anonymous requests and invalid JWTs by client IP.
+
+    Requests over the limit get a 429 response with a `Retry-After` header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, 'view_class', None)
+
+        if view_class is None:
+            return None
+
+        limit = settings.API_RATE_LIMITS.get(view_class.__name__)
+
+        if limit is None:
+            return None
+
+        rate, capacity = limit
+        identity, token_key = self.client_identity(request)
+        result = take_token(
+            view_class.__name__, identity, rate, capacity,
+            required_key=token_key,
+            fallback_identifier=f"ip:{get_client_ip(request)}"
+        )
+
+        if result.allowed:
+            return None
+
+        response = create_response(
+            success=False,
+            message='Too many requests, please try again later.',
+            status=429
+        )
+        response['Retry-After'] = str(result.retry_after)
+        return response
+
+
+    def client_identity(self, request):
+        """
+        Returns the identifier of the client's bucket, and the token cache key that
+        must exist for it to be used (None if the identifier needs no check).
+        """
+        auth_header = get_authorization_header(request).split()
+
+        if len(auth_header) == 2 and auth_header[0].lower() == b'bearer':
+            access_token = auth_header[1].decode(errors='replace')
+
+            if looks_like_jwt(access_token):
+                try:
+                    return f"user:{decode_access_token(access_token)['sub']}", None
+                except jwt.InvalidTokenError:
+                    pass
+            else:
+                return f"token:{hashlib.sha256(access_token.encode()).hexdigest()[:32]}", token_cache_key(access_token)
+
+        return f"ip:{get_client_ip(request)}", None
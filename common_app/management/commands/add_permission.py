@@ -1,5 +1,5 @@
 import uuid
-from common_app.models import Permission, Role
+from common_app.models import Permission, Role, RolePermission
 from django.core.management.base import BaseCommand
 
 class Command(BaseCommand):
@@ -19,10 +19,11 @@ class Command(BaseCommand):
                 # Fetch the Role instance
                 role = Role.objects.get(name=role_name)
 
-                # Create Permission instance for the role
-                Permission.objects.create(
+                # Create Permission instance and link it to the role
+                permission = Permission.objects.create(permission=permissions)
+                RolePermission.objects.create(
                     role_id=role,  # Assign the Role instance
-                    permission=permissions
+                    permission_id=permission
                 )
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -0,0 +1,76 @@
+import time
+import uuid
+import decimal
+
+from django.utils import timezone
+from utils import json_renderer
+from django.core.management.base import BaseCommand
+
+class Command(BaseCommand):
+    help = "Benchmark the JSON renderers on a list response shaped like TourPackage `.values()` rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000,
+                            help='Number of rows in the list response.')
+        parser.add_argument('--repeat', type=int, default=10,
+                            help='Number of times each renderer encodes the response.')
+
+    def handle(self, *args, **options):
+        payload = {
+            'success': True,
+            'message': 'Retrieved successfully.',
+            'data': self._rows(options['rows']),
+        }
+
+        renderers = [('django', json_renderer._render_django)]
+
+        if json_renderer.orjson is not None:
+            renderers.append(('orjson', json_renderer._render_orjson))
+        else:
+            self.stdout.write(self.style.WARNING("orjson is not installed, only the django renderer is measured"))
+
+        self.stdout.write(f"rows={options['rows']} repeat={options['repeat']}")
+
+        for label, render in renderers:
+            size = len(render(payload))
+            started = time.perf_counter()
+
+            for _ in range(options['repeat']):
+                render(payload)
+
+            elapsed = (time.perf_counter() - started) / options['repeat']
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{label:<8} ms/response={elapsed * 1000:8.2f} bytes={size:<10} "
+                    f"MB/sec={size / elapsed / 1_000_000:8.1f}"
+                )
+            )
+
+    def _rows(self, count):
+        now = timezone.now()
+        today = now.date()
+
+        return [
+            {
+                'id': uuid.uuid4(),
+                'user_id_id': uuid.uuid4(),
+                'travel_agency_id_id': None,
+                'package_name': f'Package {index}',
+                'description': 'Seven days across the valley with guided treks and local food. ' * 4,
+                'base_price': decimal.Decimal('24999.00'),
+                'discount_price': decimal.Decimal('1999.50'),
+                'duration_days': 7,
+                'start_date': today,
+                'end_date': today,
+                'bidding_end_date': today,
+                'trip_type': 'adventure',
+                'deposit_percentage': decimal.Decimal('20.00'),
+                'cancellation_policy': True,
+                'itinerary_flexibility': False,
+                'package_status': 'active',
+                'created_at': now,
+                'updated_at': now,
+            }
+            for index in range(count)
+        ]
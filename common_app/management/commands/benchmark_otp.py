@@ -0,0 +1,41 @@
+import time
+import uuid
+
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from utils.utils import generate_otp, verify_otp
+
+class Command(BaseCommand):
+    help = "Benchmark OTP generate + verify round trips (ops/sec) against the configured Redis"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--operations', type=int, default=10000,
+                            help='Number of generate + verify pairs.')
+        parser.add_argument('--workers', type=int, default=16,
+                            help='Number of concurrent client threads.')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"operations={options['operations']} workers={options['workers']}")
+
+        elapsed = self._run(self._round_trip, options['operations'], options['workers'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"ops/sec={options['operations'] / elapsed:10.1f} "
+                f"avg_ms={elapsed / options['operations'] * 1000 * options['workers']:7.3f}"
+            )
+        )
+
+    def _run(self, round_trip, operations, workers):
+        users = [SimpleNamespace(id=uuid.uuid4()) for _ in range(operations)]
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(round_trip, users))
+
+        return time.perf_counter() - started
+
+    def _round_trip(self, user):
+        otp = generate_otp(user)
+        verify_otp(user.id, otp)
@@ -0,0 +1,62 @@
+import os
+import time
+
+from django.conf import settings
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+class Command(BaseCommand):
+    help = "Benchmark password verification (logins/sec per core) for the current and tuned PBKDF2 settings"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tuned-iterations', type=int, nargs='+', default=[600000],
+                            help='PBKDF2 iteration counts to compare against the current setting.')
+        parser.add_argument('--workers', type=int, default=settings.PASSWORD_HASH_WORKERS,
+                            help='Number of concurrent verifier threads.')
+        parser.add_argument('--duration', type=float, default=3.0,
+                            help='Seconds to run each configuration.')
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        cores = min(workers, os.cpu_count() or 1)
+        configurations = [('current', settings.PASSWORD_HASH_ITERATIONS)]
+        configurations += [('tuned', iterations) for iterations in options['tuned_iterations']]
+
+        self.stdout.write(f"workers={workers} cores={cores} duration={options['duration']}s")
+
+        for label, iterations in configurations:
+            logins, elapsed = self._run(iterations, workers, options['duration'])
+            per_second = logins / elapsed
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{label:<8} iterations={iterations:<8} logins/sec={per_second:9.1f} "
+                    f"logins/sec/core={per_second / cores:8.1f}"
+                )
+            )
+
+    def _run(self, iterations, workers, duration):
+        """
+        Verifies one password hash from `workers` threads until `duration` elapses.
+        """
+        hasher = PBKDF2PasswordHasher()
+        hasher.iterations = iterations
+        encoded = hasher.encode('benchmark-password-1', hasher.salt())
+
+        def verify_until(deadline):
+            count = 0
+
+            while time.perf_counter() < deadline:
+                hasher.verify('benchmark-password-1', encoded)
+                count += 1
+
+            return count
+
+        started = time.perf_counter()
+        deadline = started + duration
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            logins = sum(executor.map(verify_until, [deadline] * workers))
+
+        return logins, time.perf_counter() - started
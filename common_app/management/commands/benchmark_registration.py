@@ -0,0 +1,109 @@
+import time
+import uuid
+
+from common_app.models import Role, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from utils.utils import create_user, is_record_exists, get_user_by_id
+
+class Command(BaseCommand):
+    help = "Benchmark user registration (registrations/sec and queries per registration) against the configured database"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--registrations', type=int, default=500,
+                            help='Number of users registered per implementation.')
+        parser.add_argument('--workers', type=int, default=4,
+                            help='Number of concurrent client threads.')
+        parser.add_argument('--iterations', type=int, default=1000,
+                            help='PBKDF2 iterations used while benchmarking, kept low so the '
+                                 'database round trips are what is measured.')
+
+    def handle(self, *args, **options):
+        role = Role.objects.first()
+
+        if not role:
+            raise CommandError("At least one role is required, run add_roles first")
+
+        creator_id = User.objects.values_list('id', flat=True).first()
+        implementations = [
+            ('legacy', self._legacy_register),
+            ('current', self._register),
+        ]
+
+        self.stdout.write(
+            f"registrations={options['registrations']} workers={options['workers']} "
+            f"iterations={options['iterations']}"
+        )
+
+        with override_settings(PASSWORD_HASH_ITERATIONS=options['iterations']):
+            for label, register in implementations:
+                try:
+                    queries = self._count_queries(register, role, creator_id)
+                    elapsed = self._run(register, role, creator_id, options['registrations'], options['workers'])
+                finally:
+                    User.objects.filter(email__startswith='benchmark-').delete()
+
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{label:<8} registrations/sec={options['registrations'] / elapsed:9.1f} "
+                        f"queries/registration={queries}"
+                    )
+                )
+
+    def _count_queries(self, register, role, creator_id):
+        with CaptureQueriesContext(connection) as captured:
+            register(self._payload(role), creator_id)
+
+        return len(captured)
+
+    def _run(self, register, role, creator_id, registrations, workers):
+        payloads = [self._payload(role) for _ in range(registrations)]
+        batches = [payloads[index::workers] for index in range(workers)]
+
+        def register_batch(batch):
+            try:
+                for payload in batch:
+                    register(payload, creator_id)
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(register_batch, batches))
+
+        return time.perf_counter() - started
+
+    def _payload(self, role):
+        key = uuid.uuid4()
+
+        return {
+            'first_name': 'Benchmark',
+            'last_name': 'User',
+            'email': f'benchmark-{key.hex}@example.com',
+            'phone_no': str(key.int)[:15],
+            'gender': 'other',
+            'password': 'benchmark-password-1',
+            'role_id': role.id,
+            'country_code': '+1',
+        }
+
+    def _register(self, payload, creator_id):
+        create_user(validated_data=payload, user_id=creator_id)
+
+    def _legacy_register(self, payload, creator_id):
+        """
+        The previous implementation: existence checks, role and creator lookups,
+        then an INSERT followed by an UPDATE.
+        """
+        if is_record_exists(phone_no=payload['phone_no'], email=payload['email']):
+            return
+
+        payload = dict(payload)
+        payload['role_id'] = Role.objects.filter(id=payload['role_id']).first()
+        payload['created_by'] = get_user_by_id(user_id=creator_id)
+
+        user = User.objects.create(**payload)
+        user.save()
@@ -0,0 +1,42 @@
+import json
+
+from common_app.models import User
+from django.core.management.base import BaseCommand, CommandError
+from utils.bulk_import import get_import_format, iter_rows
+from utils.vehicle_import import import_transport_vehicles
+
+class Command(BaseCommand):
+    help = "Import transport vehicles for a user from a CSV or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or NDJSON file to import.')
+        parser.add_argument('--user', required=True,
+                            help='ID of the user owning the imported vehicles.')
+        parser.add_argument('--input-format', choices=['csv', 'ndjson'],
+                            help='File format, guessed from the extension by default.')
+        parser.add_argument('--chunk-size', type=int,
+                            help='Rows validated and inserted per chunk (default: IMPORT_CHUNK_SIZE).')
+        parser.add_argument('--report',
+                            help='Write the per-row error report to this file as JSON.')
+
+    def handle(self, *args, **options):
+        if not User.objects.filter(id=options['user']).exists():
+            raise CommandError(f"User {options['user']} not found")
+
+        file_format = get_import_format(options['path'], options['input_format'])
+
+        with open(options['path'], 'rb') as stream:
+            report = import_transport_vehicles(
+                options['user'], iter_rows(stream, file_format), options['chunk_size']
+            )
+
+        if options['report']:
+            with open(options['report'], 'w') as report_file:
+                json.dump(report['errors'], report_file, indent=2)
+        else:
+            for error in report['errors']:
+                self.stdout.write(self.style.WARNING(f"row {error['row']}: {json.dumps(error['errors'])}"))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {report['created']} vehicles, {report['failed']} rows failed")
+        )
@@ -0,0 +1,88 @@
+import time
+import redis
+
+from django.db import connection
+from django.utils import timezone
+from common_app.models import OAuthAccessToken
+from django.core.management.base import BaseCommand
+from utils.redis_client import redis_client
+
+
+METRICS_KEY = 'purge_expired_tokens:metrics'
+
+
+class Command(BaseCommand):
+    help = "Delete OAuth access tokens whose access and refresh tokens have both expired, in small batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Maximum number of rows deleted per statement.')
+        parser.add_argument('--sleep', type=float, default=0.1,
+                            help='Seconds to pause between batches.')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running and purge every --interval seconds.')
+        parser.add_argument('--interval', type=int, default=3600,
+                            help='Seconds between runs when --loop is set.')
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            deleted, batches = self._purge(options['batch_size'], options['sleep'])
+            elapsed = time.perf_counter() - started
+
+            self._record_metrics(deleted, batches, elapsed)
+            self.stdout.write(
+                self.style.SUCCESS(f"Deleted {deleted} expired tokens in {batches} batches ({elapsed:.2f}s)")
+            )
+
+            if not options['loop']:
+                break
+
+            time.sleep(options['interval'])
+
+    def _purge(self, batch_size, pause):
+        """
+        Deletes expired rows `batch_size` at a time, each batch in its own short statement.
+
+        Each statement only locks the rows it deletes; rows locked by a concurrent
+        login are skipped (where supported) and picked up by a later run.
+        """
+        table = OAuthAccessToken._meta.db_table
+        skip_locked = ' FOR UPDATE SKIP LOCKED' if connection.features.has_select_for_update_skip_locked else ''
+        sql = (
+            f'DELETE FROM {table} WHERE id IN ('
+            f'SELECT id FROM {table} WHERE expires_at < %s '
+            f'AND (refresh_expires_at IS NULL OR refresh_expires_at < %s) '
+            f'LIMIT %s{skip_locked})'
+        )
+
+        deleted = 0
+        batches = 0
+        now = timezone.now()
+
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [now, now, batch_size])
+                rowcount = cursor.rowcount
+
+            deleted += rowcount
+            batches += 1
+
+            if rowcount < batch_size:
+                return deleted, batches
+
+            time.sleep(pause)
+
+    def _record_metrics(self, deleted, batches, elapsed):
+        try:
+            pipeline = redis_client.pipeline()
+            pipeline.hset(METRICS_KEY, mapping={
+                'last_run_at': timezone.now().isoformat(),
+                'last_run_deleted': deleted,
+                'last_run_batches': batches,
+                'last_run_seconds': round(elapsed, 3),
+            })
+            pipeline.hincrby(METRICS_KEY, 'total_deleted', deleted)
+            pipeline.execute()
+        except redis.RedisError:
+            pass
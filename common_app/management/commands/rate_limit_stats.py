@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from utils.rate_limit import get_rate_limit_stats
+
+class Command(BaseCommand):
+    help = "Print the allowed/blocked hit counters of the rate limiters"
+
+    def handle(self, *args, **kwargs):
+        stats = get_rate_limit_stats()
+
+        if not stats:
+            self.stdout.write("No rate limit counters recorded")
+            return
+
+        for field in sorted(stats):
+            self.stdout.write(f"{field:<40} {stats[field]}")
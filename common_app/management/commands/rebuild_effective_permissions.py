@@ -0,0 +1,15 @@
+from common_app.models import Role
+from django.core.management.base import BaseCommand
+from utils.permission_cache import invalidate_role_permissions
+from utils.effective_permissions import refresh_role_permissions
+
+class Command(BaseCommand):
+    help = "Recompute the effective_permission table for every user"
+
+    def handle(self, *args, **kwargs):
+        role_ids = list(Role.objects.values_list('id', flat=True))
+
+        invalidate_role_permissions(*role_ids)
+        refresh_role_permissions(*role_ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Effective permissions rebuilt for {len(role_ids)} roles"))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from utils.bloom_filter import rebuild_user_contacts_filter
+
+class Command(BaseCommand):
+    help = "Rebuild the Bloom filter of user emails and phone numbers from the users table"
+
+    def handle(self, *args, **kwargs):
+        count = rebuild_user_contacts_filter()
+
+        self.stdout.write(self.style.SUCCESS(f"User Bloom filter rebuilt with {count} emails and phone numbers"))
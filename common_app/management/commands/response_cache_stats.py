@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from utils.response_cache import get_response_cache_stats
+
+class Command(BaseCommand):
+    help = "Print the hit/miss counters and hit ratio of the response cache"
+
+    def handle(self, *args, **kwargs):
+        stats = get_response_cache_stats()
+        scopes = sorted({field.rsplit(':', 1)[0] for field in stats})
+
+        if not scopes:
+            self.stdout.write("No response cache counters recorded")
+            return
+
+        for scope in scopes:
+            hits = stats.get(f"{scope}:hits", 0)
+            misses = stats.get(f"{scope}:misses", 0)
+            ratio = hits / (hits + misses) if hits + misses else 0
+
+            self.stdout.write(f"{scope:<24} hits={hits:<10} misses={misses:<10} hit_ratio={ratio:.2%}")
@@ -0,0 +1,80 @@
+import time
+import redis
+import logging
+import threading
+
+from django.conf import settings
+from utils.redis_client import redis_client
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from utils.sms import QUEUE_KEY, get_backend, deliver, move_to_failed, parse_message
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Send queued SMS messages (e.g. login OTPs) with a pool of worker threads"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=settings.SMS_WORKERS,
+                            help='Number of concurrent sender threads.')
+        parser.add_argument('--max-retries', type=int, default=settings.SMS_MAX_RETRIES,
+                            help='Retries per message before it is moved to the failed list.')
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        max_retries = options['max_retries']
+        local = threading.local()
+
+        # Each thread keeps its own backend, and with it its own HTTP session. A
+        # backend that fails to initialise is retried on the next message.
+        def send(message):
+            if not hasattr(local, 'backend'):
+                try:
+                    local.backend = get_backend()
+                except Exception:
+                    logger.exception('Could not create the SMS backend')
+                    move_to_failed(message)
+                    return
+
+            deliver(local.backend, message, max_retries)
+
+        def done(future, message):
+            slots.release()
+
+            if future.exception():
+                logger.error('SMS to %s was not sent', message.get('to'), exc_info=future.exception())
+                move_to_failed(message)
+
+        # Never hold more messages than the pool can work on, so a stopped worker
+        # loses at most `workers` in-flight messages.
+        slots = threading.BoundedSemaphore(workers)
+
+        self.stdout.write(self.style.SUCCESS(f"SMS worker started with {workers} threads ({settings.SMS_BACKEND})"))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sms') as executor:
+            while True:
+                slots.acquire()
+
+                try:
+                    item = redis_client.blpop(QUEUE_KEY, timeout=2)
+                except redis.RedisError as e:
+                    slots.release()
+                    self.stderr.write(f"Redis error: {e}")
+                    time.sleep(1)
+                    continue
+
+                if item is None:
+                    slots.release()
+                    continue
+
+                message = parse_message(item[1])
+
+                if message is None:
+                    slots.release()
+                    logger.error('Dropped malformed SMS queue entry')
+                    continue
+
+                future = executor.submit(send, message)
+                future.add_done_callback(lambda future, message=message: done(future, message))
@@ -0,0 +1,62 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:49
+
+from django.db import migrations, models
+from common_app.permission_bits import PERMISSION_BITS, decode_permissions
+
+
+def permission_strings_to_masks(apps, schema_editor):
+    """
+    Encodes the comma-separated permission strings into bitmasks.
+    Unknown permission names are dropped.
+    """
+    for model_name in ('Permission', 'UserPermission'):
+        model = apps.get_model('common_app', model_name)
+        rows = list(model.objects.only('id', 'permission'))
+
+        for row in rows:
+            row.permission_mask = 0
+
+            for perm in (row.permission or '').split(','):
+                row.permission_mask |= PERMISSION_BITS.get(perm.strip(), 0)
+
+        model.objects.bulk_update(rows, ['permission_mask'], batch_size=500)
+
+
+def permission_masks_to_strings(apps, schema_editor):
+    for model_name in ('Permission', 'UserPermission'):
+        model = apps.get_model('common_app', model_name)
+        rows = list(model.objects.only('id', 'permission_mask'))
+
+        for row in rows:
+            row.permission = decode_permissions(row.permission_mask)
+
+        model.objects.bulk_update(rows, ['permission'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0024_remove_bidproposal_bid_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='permission',
+            name='permission_mask',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='userpermission',
+            name='permission_mask',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(permission_strings_to_masks, permission_masks_to_strings),
+        migrations.RemoveField(
+            model_name='permission',
+            name='permission',
+        ),
+        migrations.RemoveField(
+            model_name='userpermission',
+            name='permission',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0026_effectivepermission'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='oauthaccesstoken',
+            name='refresh_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
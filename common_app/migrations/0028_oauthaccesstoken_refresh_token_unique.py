@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0027_oauthaccesstoken_refresh_expires_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='oauthaccesstoken',
+            name='refresh_token',
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0028_oauthaccesstoken_refresh_token_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='oauthaccesstoken',
+            name='expires_at',
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
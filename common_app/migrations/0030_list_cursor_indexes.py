@@ -0,0 +1,45 @@
+# Generated by Django 5.1.4 on 2026-10-17 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0029_oauthaccesstoken_expires_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bidproposal',
+            index=models.Index(fields=['created_at', 'id'], name='bid_proposal_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='company',
+            index=models.Index(fields=['created_at', 'id'], name='companies_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='company',
+            index=models.Index(fields=['user_id', 'created_at', 'id'], name='companies_user_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='permission',
+            index=models.Index(fields=['created_at', 'id'], name='permission_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['created_at', 'id'], name='users_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user_address',
+            index=models.Index(fields=['created_at', 'id'], name='user_address_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user_address',
+            index=models.Index(fields=['user_id', 'created_at', 'id'], name='user_address_user_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userpermission',
+            index=models.Index(fields=['granted_by', 'created_at', 'id'], name='user_perm_grantor_cursor_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.1.4 on 2026-10-17 02:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_proposals(apps, schema_editor):
+    """
+    Keeps one proposal per (bid, travel agency), preferring the approved proposal
+    of the bid and then the oldest one.
+    """
+    BidProposal = apps.get_model('common_app', 'BidProposal')
+    TourPackageBid = apps.get_model('package_provider', 'TourPackageBid')
+
+    approved_ids = set(
+        TourPackageBid.objects.filter(approved_proposal_id__isnull=False).values_list('approved_proposal_id', flat=True)
+    )
+    duplicated = (
+        BidProposal.objects.values('bid_id', 'travel_agency_id')
+        .annotate(proposals=Count('id'))
+        .filter(proposals__gt=1)
+        .values_list('bid_id', 'travel_agency_id')
+    )
+
+    for bid_id, travel_agency_id in list(duplicated):
+        proposal_ids = list(
+            BidProposal.objects.filter(bid_id=bid_id, travel_agency_id=travel_agency_id)
+            .order_by('created_at', 'id')
+            .values_list('id', flat=True)
+        )
+        kept_id = next((proposal_id for proposal_id in proposal_ids if proposal_id in approved_ids), proposal_ids[0])
+
+        BidProposal.objects.filter(id__in=proposal_ids).exclude(id=kept_id).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0030_list_cursor_indexes'),
+        ('package_provider', '0011_tourpackagebid_package_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_proposals, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='bidproposal',
+            constraint=models.UniqueConstraint(fields=('bid_id', 'travel_agency_id'), name='bid_proposal_bid_agency_unique'),
+        ),
+    ]
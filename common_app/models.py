@@ -1,7 +1,8 @@
 import uuid
 from django.db import models
 from django.apps import apps
-from django.contrib.auth.hashers import make_password, check_password
+from authentication.hashing import hash_password, verify_password
+from common_app.permission_bits import PERMISSION_BITS, ALL, encode_permissions, decode_permissions
 
 
 class Role(models.Model):
@@ -54,22 +55,43 @@ class User(models.Model):
 
     class Meta:
         db_table = 'users'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='users_cursor_idx'),
+        ]
 
 
     def save(self, *args, **kwargs):
         """
         Make the user password hashed and saved it.
+        Hashing runs on the bounded password hashing pool.
         """
         if self.password and not self.password.startswith(('pbkdf2_sha256$', 'bcrypt', 'argon2')):
-            self.password = make_password(self.password)
+            self.password = hash_password(self.password)
         super().save(*args, **kwargs)
 
 
     def check_password(self, raw_password):
         """
         Check if the provided raw_password matches the hashed password stored in the database.
+
+        Verification runs on the bounded password hashing pool. If the stored hash was 
+        made with outdated hasher parameters it is replaced by a fresh hash.
+        """
+        is_correct, needs_rehash = verify_password(raw_password, self.password)
+
+        if is_correct and needs_rehash:
+            self.password = hash_password(raw_password)
+            User.objects.filter(id=self.id).update(password=self.password)
+
+        return is_correct
+
+
+    @property
+    def is_authenticated(self):
         """
-        return check_password(raw_password, self.password)
+        Always True for stored users; lets DRF treat token-authenticated users as authenticated.
+        """
+        return True
     
 
 
@@ -92,6 +114,10 @@ class User_Address(models.Model):
 
     class Meta:
         db_table = 'user_address'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='user_address_cursor_idx'),
+            models.Index(fields=['user_id', 'created_at', 'id'], name='user_address_user_cursor_idx'),
+        ]
 
 
 class OAuthApplication(models.Model):
@@ -110,9 +136,10 @@ class OAuthAccessToken(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     client = models.ForeignKey(OAuthApplication, on_delete=models.CASCADE)
     access_token = models.CharField(max_length=255, unique=True)
-    refresh_token = models.CharField(max_length=255, blank=True, null=True)
+    refresh_token = models.CharField(max_length=255, unique=True, blank=True, null=True)
+    refresh_expires_at = models.DateTimeField(blank=True, null=True)
     token_type = models.CharField(max_length=50)
-    expires_at = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -120,12 +147,28 @@ class OAuthAccessToken(models.Model):
         db_table = 'oauth_access_token'
 
 
+class PermissionQuerySet(models.QuerySet):
+    """
+    QuerySet for models storing permissions in a `permission_mask` bitmask.
+    """
+
+    def granting(self, permission_type: str):
+        """
+        Filters rows whose bitmask grants `permission_type` (directly or through 'all').
+        """
+        bits = PERMISSION_BITS.get(permission_type, 0) | ALL
+        return self.alias(
+            granted_bits=models.F('permission_mask').bitand(bits)
+        ).filter(granted_bits__gt=0)
+
+
+
 class Permission(models.Model):
 
-    PERMISSION_CHOICES = ['read', 'write', 'delete', 'update']
+    PERMISSION_CHOICES = ['read', 'write', 'delete', 'update', 'all']
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    permission = models.CharField(max_length=100)
+    permission_mask = models.PositiveSmallIntegerField(default=0)
     description = models.TextField(blank=True,null=True)
     # role_id = models.ForeignKey(Role, on_delete=models.CASCADE, related_name='role_id')
     # created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='permission_created_by')
@@ -134,21 +177,29 @@ class Permission(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
 
-    def save(self, *args, **kwargs):
+    objects = PermissionQuerySet.as_manager()
+
+
+    @property
+    def permission(self):
         """
-        Ensure permissions are valid before saving.
+        Comma-separated permission names, kept for the string based API.
         """
-        permissions_list = self.permission.split(',')
-        invalid_permissions = [
-            perm for perm in permissions_list if perm.strip() not in self.PERMISSION_CHOICES
-        ]
-        if invalid_permissions:
-            raise ValueError(f"Invalid permissions: {', '.join(invalid_permissions)}")
-        self.permission = ','.join([perm.strip() for perm in permissions_list])
-        super().save(*args, **kwargs)
+        return decode_permissions(self.permission_mask)
+
+
+    @permission.setter
+    def permission(self, value):
+        """
+        Validates the permission names and stores them as a bitmask.
+        """
+        self.permission_mask = encode_permissions(value, allowed=self.PERMISSION_CHOICES)
 
     class Meta:
         db_table = 'permission'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='permission_cursor_idx'),
+        ]
 
 
 class Company(models.Model):
@@ -174,8 +225,19 @@ class Company(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Fields clients may select with `?fields=` (see utils.utils.get_sparse_fields).
+    API_FIELDS = (
+        'id', 'user_id_id', 'company_name', 'company_email', 'registration_number',
+        'contact_number', 'foundation_date', 'city', 'state', 'country', 'street_address',
+        'pin_code', 'postal_code', 'company_status', 'created_at', 'updated_at',
+    )
+
     class Meta:
         db_table = 'companies'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='companies_cursor_idx'),
+            models.Index(fields=['user_id', 'created_at', 'id'], name='companies_user_cursor_idx'),
+        ]
 
 
 
@@ -191,31 +253,34 @@ class UserPermission(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name='user_permissions')
     granted_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='granted_by_permissions')
-    permission = models.CharField(max_length=100)
+    permission_mask = models.PositiveSmallIntegerField(default=0)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def save(self, *args, **kwargs):
+    objects = PermissionQuerySet.as_manager()
+
+
+    @property
+    def permission(self):
         """
-        Ensure permissions are valid before saving.
-        This method checks that each permission in the permission list
-        is valid according to the permission_choices.
+        Comma-separated permission names, kept for the string based API.
         """
-        permissions_list = self.permission.split(',')
-        
-        invalid_permissions = [
-            perm.strip() for perm in permissions_list if perm.strip() not in dict(self.permission_choices).keys()
-        ]
-        
-        if invalid_permissions:
-            raise ValueError(f"Invalid permissions: {', '.join(invalid_permissions)}")
+        return decode_permissions(self.permission_mask)
 
-        self.permission = ','.join([perm.strip() for perm in permissions_list])
-        super().save(*args, **kwargs)
+
+    @permission.setter
+    def permission(self, value):
+        """
+        Validates the permission names against permission_choices and stores them as a bitmask.
+        """
+        self.permission_mask = encode_permissions(value, allowed=dict(self.permission_choices).keys())
 
     class Meta:
         db_table = 'user_permissions'
+        indexes = [
+            models.Index(fields=['granted_by', 'created_at', 'id'], name='user_perm_grantor_cursor_idx'),
+        ]
 
 
 
@@ -245,8 +310,20 @@ class BidProposal(models.Model):
             TourPackage = apps.get_model('travel_agency', 'TransportVehicle')
             return TourPackage.objects.filter(id=self.travel_agency_id).first()
 
+    # Fields clients may select with `?fields=` (see utils.utils.get_sparse_fields).
+    API_FIELDS = (
+        'id', 'bid_id', 'travel_agency_id', 'bid_price', 'description', 'created_at',
+        'updated_at',
+    )
+
     class Meta:
         db_table = 'bid_proposal'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='bid_proposal_cursor_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['bid_id', 'travel_agency_id'], name='bid_proposal_bid_agency_unique'),
+        ]
 
 
 class VehicleType(models.Model):
@@ -269,4 +346,20 @@ class RolePermission(models.Model):
 
 
     class Meta:
-        db_table = 'role_permission'
\ No newline at end of file
+        db_table = 'role_permission'
+
+
+
+class EffectivePermission(models.Model):
+    """
+    Materialized permission bitmask of a user: the union of their role's
+    permissions and their active `UserPermission` grants. Kept up to date by
+    signals (see `utils.effective_permissions`).
+    """
+    user_id = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='effective_permission')
+    permission_mask = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+    class Meta:
+        db_table = 'effective_permission'
@@ -0,0 +1,70 @@
+"""
+Bitmask encoding of the permission names used by `Permission` and `UserPermission`.
+
+Permissions used to be stored as comma-separated strings ('read,write'); they are
+now stored as an integer where every permission is a single bit, so checking a
+permission is one AND and permissions can be filtered in SQL with bitwise operators.
+The 'all' bit grants every permission.
+"""
+
+READ = 1
+WRITE = 2
+UPDATE = 4
+DELETE = 8
+ALL = 16
+
+PERMISSION_BITS = {
+    'read': READ,
+    'write': WRITE,
+    'update': UPDATE,
+    'delete': DELETE,
+    'all': ALL,
+}
+
+
+def encode_permissions(permissions, allowed=None) -> int:
+    """
+    Converts permission names into a bitmask.
+
+    Args:
+        permissions (str or iterable): Comma-separated permission names ('read,write')
+            or an iterable of names.
+        allowed (iterable, optional): The permission names accepted. Defaults to
+            every name in `PERMISSION_BITS`.
+
+    Returns:
+        int: The bitmask with a bit set for every given permission.
+
+    Raises:
+        ValueError: If any of the names is not an allowed permission.
+    """
+    if isinstance(permissions, str):
+        permissions = permissions.split(',')
+
+    allowed = PERMISSION_BITS.keys() if allowed is None else allowed
+    names = [perm.strip() for perm in permissions if perm.strip()]
+    invalid_permissions = [perm for perm in names if perm not in allowed]
+
+    if invalid_permissions:
+        raise ValueError(f"Invalid permissions: {', '.join(invalid_permissions)}")
+
+    mask = 0
+
+    for perm in names:
+        mask |= PERMISSION_BITS[perm]
+
+    return mask
+
+
+def decode_permissions(mask: int) -> str:
+    """
+    Converts a bitmask back into the comma-separated string used by the API.
+    """
+    return ','.join(name for name, bit in PERMISSION_BITS.items() if mask & bit)
+
+
+def has_permission(mask: int, permission_type: str) -> bool:
+    """
+    Checks whether a bitmask grants `permission_type` (directly or through 'all').
+    """
+    return bool(mask & (PERMISSION_BITS.get(permission_type, 0) | ALL))
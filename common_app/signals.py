@@ -0,0 +1,93 @@
+from django.db import transaction
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+from utils.token_cache import evict_token
+from utils.bloom_filter import remember_user_contacts
+from utils.permission_cache import invalidate_role_permissions, invalidate_role_name
+from common_app.models import Role, User, Permission, RolePermission, UserPermission, OAuthAccessToken
+from utils.effective_permissions import (refresh_user_permissions, refresh_role_permissions, forget_user_permissions,
+                                         seed_user_permissions)
+
+
+@receiver([post_save, post_delete], sender=Role, dispatch_uid='role_name_cache_invalidation')
+def invalidate_role_name_cache(sender, instance, **kwargs):
+    """
+    Drops the cached name of a renamed or deleted role.
+    """
+    invalidate_role_name(instance.id)
+
+
+@receiver([post_save, post_delete], sender=RolePermission, dispatch_uid='role_permission_cache_invalidation')
+def invalidate_role_permission_cache(sender, instance, **kwargs):
+    """
+    Drops the cached permissions of the role a `RolePermission` row belongs to
+    and recomputes the effective permissions of its users.
+    """
+    role_id = instance.role_id_id
+    invalidate_role_permissions(role_id)
+    transaction.on_commit(lambda: refresh_role_permissions(role_id))
+
+
+@receiver([post_save, post_delete], sender=Permission, dispatch_uid='permission_cache_invalidation')
+def invalidate_permission_cache(sender, instance, **kwargs):
+    """
+    Drops the cached permissions of every role linked to a `Permission`
+    and recomputes the effective permissions of their users.
+
+    On delete the linked `RolePermission` rows are cascaded first and invalidate
+    their own roles, so the lookup below only matters for saves.
+    """
+    role_ids = list(RolePermission.objects.filter(permission_id=instance).values_list('role_id', flat=True))
+    invalidate_role_permissions(*role_ids)
+    transaction.on_commit(lambda: refresh_role_permissions(*role_ids))
+
+
+@receiver([post_save, post_delete], sender=UserPermission, dispatch_uid='user_permission_effective_refresh')
+def refresh_user_grant(sender, instance, **kwargs):
+    """
+    Recomputes the effective permissions of the user a grant belongs to.
+    """
+    user_id = instance.user_id_id
+    transaction.on_commit(lambda: refresh_user_permissions(user_id))
+
+
+@receiver(post_save, sender=User, dispatch_uid='user_effective_permission_refresh')
+def refresh_user_role(sender, instance, created=False, **kwargs):
+    """
+    Recomputes the effective permissions of a saved user, whose role may have changed.
+
+    New users are seeded right away, in the transaction that inserted them.
+    """
+    if created:
+        seed_user_permissions(instance.id, instance.role_id_id)
+        return
+
+    user_id = instance.id
+    transaction.on_commit(lambda: refresh_user_permissions(user_id))
+
+
+@receiver(post_save, sender=User, dispatch_uid='user_contacts_bloom_filter')
+def remember_saved_user_contacts(sender, instance, **kwargs):
+    """
+    Adds the email and phone number of a saved user to the user Bloom filter.
+
+    The values are added once the transaction commits, so a filter rebuild that
+    reads the table in between still sees them and re-adds them after its swap.
+    """
+    transaction.on_commit(lambda: remember_user_contacts(instance))
+
+
+@receiver(post_delete, sender=User, dispatch_uid='user_effective_permission_cleanup')
+def forget_deleted_user(sender, instance, **kwargs):
+    """
+    Drops a deleted user from the effective permission caches.
+    """
+    forget_user_permissions(instance.id)
+
+
+@receiver(post_delete, sender=OAuthAccessToken, dispatch_uid='access_token_cache_eviction')
+def evict_access_token_cache(sender, instance, **kwargs):
+    """
+    Evicts a deleted access token (e.g. when its user is removed) from the token cache.
+    """
+    evict_token(instance.access_token)
@@ -6,7 +6,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from common_app.models import BidProposal
 from common_app.serializer.bidding_proposal_serializer import TourPackageBidSerializer
-from utils.utils import create_response, get_user_by_id, check_permissions, validate_roles_for_admin, update_record
+from utils.db import insert_ignoring_conflicts
+from utils.utils import create_response, create_list_response, check_permissions, validate_roles_for_admin, update_record, get_sparse_fields
 
 
 
@@ -17,7 +18,16 @@ class PackageProposalManagement(APIView):
             bid_id: uuid.UUID=None,
         ) -> Response:
         try:
-            user = get_user_by_id(user_id=user_id)
+            fields, error_message = get_sparse_fields(request, BidProposal)
+
+            if error_message:
+                return create_response(
+                    success=False,
+                    message=error_message,
+                    status=400
+                )
+
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -37,7 +47,7 @@ class PackageProposalManagement(APIView):
                 return validate_role
 
             if bid_id:
-                bid = BidProposal.objects.filter(id=bid_id).values().first()
+                bid = BidProposal.objects.filter(id=bid_id).values(*fields).first()
 
                 if not bid:
                     return create_response(
@@ -55,9 +65,9 @@ class PackageProposalManagement(APIView):
                 )
 
             else:
-                biddings = BidProposal.objects.values().all()
+                biddings = BidProposal.objects.values(*fields).all()
 
-                if not biddings:
+                if not biddings.exists():
                     return create_response(
                         success=False,
                         message='Bid not found.',
@@ -65,11 +75,11 @@ class PackageProposalManagement(APIView):
                         status=404
                     )
 
-                return create_response(
-                    success=True,
+                return create_list_response(
+                    request,
                     message='Retrieved bid details.',
-                    data=list(biddings),
-                    status=200
+                    queryset=biddings,
+                    stream=True
                 )
 
         except:
@@ -84,7 +94,7 @@ class PackageProposalManagement(APIView):
             user_id: uuid.UUID,
         ) -> Response:
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -108,16 +118,22 @@ class PackageProposalManagement(APIView):
             if serializer.is_valid():
                 validated_data = serializer.validated_data
 
-                validate_bidding = BidProposal.objects.filter(bid_id=validated_data['bid_id'], travel_agency_id=validated_data['travel_agency_id']).first()
+                # The unique constraint on (bid_id, travel_agency_id) settles concurrent
+                # bids from the same agency in the INSERT itself.
+                proposal = BidProposal(
+                    bid_id=validated_data['package_necessities_id'],
+                    travel_agency_id=validated_data['travel_agency_id'],
+                    bid_price=validated_data['bid_price'],
+                    description=validated_data.get('description'),
+                )
 
-                if validate_bidding:
+                if not insert_ignoring_conflicts(proposal, ['bid_id', 'travel_agency_id']):
                     return create_response(
                         success=False,
                         message='Bid already exist',
                         status=409
                     )
 
-                BidProposal.objects.create(**validated_data)
                 return create_response(
                     success=True,
                     message='Bid create.',
@@ -146,7 +162,7 @@ class PackageProposalManagement(APIView):
             bid_id: uuid.UUID=None,
         ) -> Response:
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -211,7 +227,7 @@ class PackageProposalManagement(APIView):
             bid_id: uuid.UUID=None,
         ) -> Response:
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
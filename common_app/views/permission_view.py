@@ -3,9 +3,10 @@ import uuid
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
+from common_app.permission_bits import decode_permissions
 from common_app.models import Permission, Role
 from common_app.serializer.permission_serializer import PermissionSerializer
-from utils.utils import create_response, check_permissions, get_user_by_id, update_record
+from utils.utils import create_response, create_list_response, check_permissions, update_record
 
 
 class PermissionManagement(APIView):
@@ -40,7 +41,7 @@ class PermissionManagement(APIView):
 
         try:
 
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -65,6 +66,8 @@ class PermissionManagement(APIView):
                         status=404
                     )
 
+                permission['permission'] = decode_permissions(permission['permission_mask'])
+
                 return create_response(
                         success=True,
                         message='Retrieved successfully.',
@@ -76,7 +79,7 @@ class PermissionManagement(APIView):
 
                 permission_list = Permission.objects.filter(created_by=user_id).values().all()
 
-                if not permission_list:
+                if not permission_list.exists():
                     return create_response(
                         success=False,
                         message='Permission not found.',
@@ -84,11 +87,11 @@ class PermissionManagement(APIView):
                         status=404
                     )
 
-                return create_response(
-                        success=True,
+                return create_list_response(
+                        request,
                         message='Retrieved Permissions successfully.',
-                        data=list(permission_list),
-                        status=200
+                        queryset=permission_list,
+                        transform=lambda row: {**row, 'permission': decode_permissions(row['permission_mask'])}
                     )
 
         except:
@@ -119,7 +122,7 @@ class PermissionManagement(APIView):
         """
 
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -196,7 +199,7 @@ class PermissionManagement(APIView):
 
         try:
 
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
             permission = Permission.objects.filter(id=permission_id).first()
 
             if not user:
@@ -273,7 +276,7 @@ class PermissionManagement(APIView):
 
         try:
 
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
             permission = Permission.objects.filter(id=permission_id).first()
 
             if not user:
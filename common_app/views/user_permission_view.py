@@ -3,9 +3,11 @@ import uuid
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
+from common_app.permission_bits import decode_permissions
+from utils.effective_permissions import get_effective_permissions
 from common_app.models import UserPermission
 from common_app.serializer.user_permission_serializer import UserPermissionSerializer
-from utils.utils import create_response, get_user_by_id, check_permissions, update_record
+from utils.utils import create_response, create_list_response, get_user_by_id, check_permissions, update_record
 
 
 class UserPermissionManagement(APIView):
@@ -16,7 +18,7 @@ class UserPermissionManagement(APIView):
         ) -> Response:
 
         try:
-            grant_user = get_user_by_id(user_id=granted_by)
+            grant_user = request.principal
 
             if not grant_user:
                 return create_response(
@@ -41,6 +43,8 @@ class UserPermissionManagement(APIView):
                         status=404
                     )
                 
+                user_permission['permission'] = decode_permissions(user_permission['permission_mask'])
+
                 return create_response(
                     success=True,
                     message='Retrieved permission.',
@@ -51,19 +55,19 @@ class UserPermissionManagement(APIView):
             else:
                 permission_list = UserPermission.objects.filter(granted_by=granted_by).values().all()
 
-                if not permission_list:
+                if not permission_list.exists():
                     return create_response(
                         success=False,
                         message='User Permission not found.',
                         data=[],
                         status=404
                     )
-                
-                return create_response(
-                    success=True,
+
+                return create_list_response(
+                    request,
                     message='Retrieved permissions successfully.',
-                    data=list(permission_list),
-                    status=200
+                    queryset=permission_list,
+                    transform=lambda row: {**row, 'permission': decode_permissions(row['permission_mask'])}
                 )
 
         except:
@@ -76,7 +80,7 @@ class UserPermissionManagement(APIView):
 
     def post(self, request: Request, granted_by: uuid.UUID) -> Response:
         try:
-            grant_user = get_user_by_id(user_id=granted_by)
+            grant_user = request.principal
 
             if not grant_user:
                 return create_response(
@@ -154,7 +158,7 @@ class UserPermissionManagement(APIView):
         ) -> Response:
 
         try:
-            grant_user = get_user_by_id(user_id=granted_by)
+            grant_user = request.principal
 
             if not grant_user:
                 return create_response(
@@ -217,7 +221,7 @@ class UserPermissionManagement(APIView):
         ) -> Response:
 
         try:
-            grant_user = get_user_by_id(user_id=granted_by)
+            grant_user = request.principal
 
             if not grant_user:
                 return create_response(
@@ -252,4 +256,60 @@ class UserPermissionManagement(APIView):
                 success=False,
                 message='Something went wrong.',
                 status=500
-            )
\ No newline at end of file
+            )
+
+
+
+class MyPermissions(APIView):
+    """
+    APIView exposing the effective permissions of the acting user.
+
+    Effective permissions combine the permissions of the user's role with
+    their active user permission grants and are read from the materialized
+    effective permission cache.
+    """
+
+    def get(self, request: Request, user_id: uuid.UUID) -> Response:
+        """
+        Retrieve the effective permissions of a user.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            user_id (uuid.UUID): The ID of the acting user.
+
+        Returns:
+            Response:
+                - 200: Success with the permission names and bitmask.
+                - 404: User not found.
+                - 500: Internal server error.
+        """
+        try:
+            user = request.principal
+
+            if not user:
+                return create_response(
+                    success=False,
+                    message='User not found.',
+                    status=404
+                )
+
+            permission_mask = get_effective_permissions(user)
+
+            return create_response(
+                success=True,
+                message='Retrieved permissions successfully.',
+                data={
+                    'user_id': user.id,
+                    'role': user.role_id.name,
+                    'permission': decode_permissions(permission_mask),
+                    'permission_mask': permission_mask,
+                },
+                status=200
+            )
+
+        except:
+            return create_response(
+                success=False,
+                message='Something went wrong.',
+                status=500
+            )
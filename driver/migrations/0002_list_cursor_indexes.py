@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-17 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0030_list_cursor_indexes'),
+        ('driver', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='driver',
+            index=models.Index(fields=['created_at', 'id'], name='driver_cursor_idx'),
+        ),
+    ]
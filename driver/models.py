@@ -25,5 +25,15 @@ class Driver(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Fields clients may select with `?fields=` (see utils.utils.get_sparse_fields).
+    API_FIELDS = (
+        'id', 'user_id_id', 'experience_years', 'hire_date', 'license_number', 'license_type',
+        'license_issue_date', 'license_expiration_date', 'emergency_contact_name',
+        'emergency_contact_no', 'created_at', 'updated_at',
+    )
+
     class Meta:
-        db_table = 'driver'
\ No newline at end of file
+        db_table = 'driver'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='driver_cursor_idx'),
+        ]
\ No newline at end of file
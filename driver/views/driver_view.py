@@ -5,7 +5,7 @@ from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 from driver.serializer.driver_serializer import DriverSerializer
-from utils.utils import create_response, get_user_by_id, update_record, validate_travel_agency_roles, check_permissions
+from utils.utils import create_response, create_list_response, get_user_by_id, update_record, validate_travel_agency_roles, check_permissions, get_sparse_fields
 
 class DriverManagement(APIView):
     """
@@ -41,9 +41,18 @@ class DriverManagement(APIView):
         """
 
         try:
+            fields, error_message = get_sparse_fields(request, Driver)
+
+            if error_message:
+                return create_response(
+                    success=False,
+                    message=error_message,
+                    status=400
+                )
+
             if user_id:
                 
-                user = Driver.objects.filter(user_id=user_id).values().first()
+                user = Driver.objects.filter(user_id=user_id).values(*fields).first()
 
                 if not user:
                     return create_response(
@@ -62,9 +71,9 @@ class DriverManagement(APIView):
             
             else:
 
-                user_list = Driver.objects.values().all()
+                user_list = Driver.objects.values(*fields).all()
                 
-                if not user_list:
+                if not user_list.exists():
                     return create_response(
                         success=False,
                         message='User not found.',
@@ -72,11 +81,11 @@ class DriverManagement(APIView):
                         status=404
                     ) 
                 
-                return create_response(
-                    success= True, 
+                return create_list_response(
+                    request,
                     message='Retrieved drivers successfully',
-                    data=list(user_list),
-                    status=200
+                    queryset=user_list,
+                    stream=True
                 )
 
         except Exception as e:
@@ -10,11 +10,16 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 from pathlib import Path
+from dotenv import load_dotenv
 import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Read `.env` before any setting below, so every process (web workers, the SMS
+# worker and other management commands) sees the same configuration.
+load_dotenv()
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -49,6 +54,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'authentication.middleware.PrincipalMiddleware',
+    'authentication.middleware.RateLimitMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -109,10 +116,34 @@ AUTH_PASSWORD_VALIDATORS = [
 
 # AUTH_USER_MODEL = 'common_app.User'
 
+# Password hashing
+# PBKDF2 iterations are configurable; stored hashes are upgraded on the next login
+# when they change. Hashing runs on a bounded thread pool (see authentication.hashing).
+
+PASSWORD_HASHERS = [
+    'authentication.hashing.ConfigurablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+PASSWORD_HASH_ITERATIONS = int(os.getenv('PASSWORD_HASH_ITERATIONS', 870000))
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+PASSWORD_HASH_QUEUE_SIZE = 32
+PASSWORD_HASH_QUEUE_TIMEOUT = 2
+PASSWORD_HASH_BATCH_SLOTS = max(1, PASSWORD_HASH_WORKERS // 2)
+
 AUTHENTICATION_BACKENDS = [
     'authentication.authentication.OAuthBackend',  # Path to your custom backend
 ]
 
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'authentication.authentication.BearerTokenAuthentication',
+    ],
+}
+
 
 
 # Internationalization
@@ -140,3 +171,115 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 MEDIA_URL = '/media/'  # URL for media files
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media') 
 
+
+
+# Redis
+
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 50))
+REDIS_SOCKET_TIMEOUT = 5
+
+
+
+# Permission caches
+# Role permissions are cached per role and effective permissions per user,
+# in-process (short TTL) and in Redis.
+
+PERMISSION_CACHE_TTL = 60 * 60
+PERMISSION_CACHE_LOCAL_TTL = 30
+PERMISSION_CACHE_LOCAL_SIZE = 256
+EFFECTIVE_PERMISSION_CACHE_LOCAL_SIZE = 10000
+EFFECTIVE_PERMISSION_CACHE_TTL = 10 * 60
+
+
+
+# Access tokens
+# 'opaque' issues random tokens looked up through the token cache; 'jwt' issues
+# short-lived signed tokens verified locally against a revocation list snapshot.
+
+TOKEN_MODE = os.getenv('TOKEN_MODE', 'opaque')
+REFRESH_TOKEN_LIFETIME = 30 * 24 * 60 * 60
+JWT_SIGNING_KEY = os.getenv('JWT_SIGNING_KEY', SECRET_KEY)
+JWT_ALGORITHM = 'HS256'
+JWT_ACCESS_TOKEN_LIFETIME = 15 * 60
+JWT_REVOCATION_REFRESH_INTERVAL = 30
+
+
+
+# SMS
+# Messages are queued in Redis and sent by `manage.py sms_worker`. Use
+# 'utils.sms.FakeBackend' to run the login flow without an SMS provider.
+# OTP messages are dropped once the OTP has expired. Failed messages are kept,
+# without their body, in a capped list for `SMS_FAILED_TTL` seconds.
+
+SMS_BACKEND = os.getenv('SMS_BACKEND', 'utils.sms.TwilioBackend')
+TWILIO_SID = os.getenv('TWILIO_SID')
+TWILIO_TOKEN = os.getenv('TWILIO_TOKEN')
+TWILIO_FROM_NUMBER = os.getenv('TWILIO_FROM_NUMBER', '+1 218 506 1882')
+SMS_WORKERS = int(os.getenv('SMS_WORKERS', 8))
+SMS_MAX_RETRIES = 3
+SMS_FAKE_LATENCY = float(os.getenv('SMS_FAKE_LATENCY', 0))
+SMS_FAILED_SIZE = 1000
+SMS_FAILED_TTL = 7 * 24 * 60 * 60
+OTP_LIFETIME = 5 * 60
+
+
+
+# Rate limiting
+# Sliding-window limits as (max_hits, window_seconds) per scope.
+
+SLIDING_WINDOW_RATE_LIMITS = {
+    'otp_send_phone': (3, 10 * 60),
+    'otp_send_ip': (30, 10 * 60),
+    'otp_verify_user': (5, 10 * 60),
+    'otp_verify_ip': (50, 10 * 60),
+}
+
+# Token-bucket limits per view class as (tokens_per_second, burst), applied per
+# user (or per IP for anonymous requests) by `RateLimitMiddleware`.
+API_RATE_LIMITS = {
+    'UserManagement': (2, 20),
+    'Addresses': (2, 20),
+    'CompanyManagement': (2, 20),
+    'DriverManagement': (2, 20),
+}
+
+TRUST_X_FORWARDED_FOR = os.getenv('TRUST_X_FORWARDED_FOR', 'false').lower() == 'true'
+
+
+
+# JSON responses
+# 'orjson' (used when installed) or 'django' for the standard library encoder.
+
+JSON_RENDERER = os.getenv('JSON_RENDERER', 'orjson')
+
+# Rows fetched and encoded per chunk by streamed list responses.
+STREAMING_CHUNK_SIZE = 2000
+
+# Keyset pagination of list endpoints (`?cursor=` / `?page_size=`).
+PAGE_SIZE = int(os.getenv('PAGE_SIZE', 50))
+MAX_PAGE_SIZE = 500
+
+# Rows validated and inserted per chunk by bulk imports.
+IMPORT_CHUNK_SIZE = 500
+
+
+
+# Response cache
+# Cached GET responses of packages and itineraries. Version keys must outlive the
+# responses, otherwise an expired version could resurrect a stale response.
+
+RESPONSE_CACHE_TTL = 5 * 60
+RESPONSE_CACHE_VERSION_TTL = 24 * 60 * 60
+
+
+
+# Bloom filter over user emails and phone numbers, letting most "not taken"
+# checks skip the database. About 1.8 MB in Redis at the default sizing. It is
+# rebuilt in the background when a lookup finds it missing, and expires
+# `USER_BLOOM_FILTER_MAX_AGE` seconds after each rebuild; `manage.py
+# rebuild_user_bloom_filter` rebuilds it on demand.
+
+USER_BLOOM_FILTER_CAPACITY = int(os.getenv('USER_BLOOM_FILTER_CAPACITY', 1_000_000))
+USER_BLOOM_FILTER_ERROR_RATE = 0.001
+USER_BLOOM_FILTER_MAX_AGE = int(os.getenv('USER_BLOOM_FILTER_MAX_AGE', 60 * 60))
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PackageProviderConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'package_provider'
+
+    def ready(self):
+        import package_provider.signals
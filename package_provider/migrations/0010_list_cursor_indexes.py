@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-17 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0030_list_cursor_indexes'),
+        ('package_provider', '0009_tourpackagebid_approved_proposal_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dailyitinerary',
+            index=models.Index(fields=['package_id', 'created_at', 'id'], name='itinerary_package_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tourpackage',
+            index=models.Index(fields=['user_id', 'created_at', 'id'], name='tour_package_user_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tourpackagebid',
+            index=models.Index(fields=['created_at', 'id'], name='tour_package_bid_cursor_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.4 on 2026-10-17 02:10
+
+from django.db import migrations, models
+from django.db.models import Count, F
+
+
+def remove_duplicate_package_bids(apps, schema_editor):
+    """
+    Keeps one bid per tour package, preferring a bid with an approved proposal and
+    then the oldest one. Proposals made on the removed bids are moved to the kept bid.
+    """
+    TourPackageBid = apps.get_model('package_provider', 'TourPackageBid')
+    BidProposal = apps.get_model('common_app', 'BidProposal')
+
+    duplicated = (
+        TourPackageBid.objects.values('tour_package_id')
+        .annotate(bids=Count('id'))
+        .filter(bids__gt=1)
+        .values_list('tour_package_id', flat=True)
+    )
+
+    for tour_package_id in list(duplicated):
+        bid_ids = list(
+            TourPackageBid.objects.filter(tour_package_id=tour_package_id)
+            .order_by(F('approved_proposal_id').desc(nulls_last=True), 'created_at', 'id')
+            .values_list('id', flat=True)
+        )
+        kept_id, removed_ids = bid_ids[0], bid_ids[1:]
+
+        BidProposal.objects.filter(bid_id__in=removed_ids).update(bid_id=kept_id)
+        TourPackageBid.objects.filter(id__in=removed_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0030_list_cursor_indexes'),
+        ('package_provider', '0010_list_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_package_bids, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='tourpackagebid',
+            constraint=models.UniqueConstraint(fields=('tour_package_id',), name='tour_package_bid_package_unique'),
+        ),
+    ]
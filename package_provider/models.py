@@ -41,8 +41,19 @@ class TourPackage(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Fields clients may select with `?fields=` (see utils.utils.get_sparse_fields).
+    API_FIELDS = (
+        'id', 'user_id_id', 'travel_agency_id_id', 'package_name', 'description', 'base_price',
+        'discount_price', 'duration_days', 'start_date', 'end_date', 'bidding_end_date',
+        'trip_type', 'deposit_percentage', 'cancellation_policy', 'itinerary_flexibility',
+        'included_services', 'excluded_services', 'package_status', 'created_at', 'updated_at',
+    )
+
     class Meta:
         db_table = 'tour_package'
+        indexes = [
+            models.Index(fields=['user_id', 'created_at', 'id'], name='tour_package_user_cursor_idx'),
+        ]
 
 
     
@@ -79,8 +90,18 @@ class DailyItinerary(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
 
+    # Fields clients may select with `?fields=` (see utils.utils.get_sparse_fields).
+    API_FIELDS = (
+        'id', 'package_id_id', 'itinerary_day', 'activity_description', 'pin_code',
+        'postal_code', 'city', 'state', 'country', 'street_address', 'longitude', 'latitude',
+        'travel_mode', 'additional_info', 'created_at', 'updated_at',
+    )
+
     class Meta:
         db_table = 'daily_itinerary'
+        indexes = [
+            models.Index(fields=['package_id', 'created_at', 'id'], name='itinerary_package_cursor_idx'),
+        ]
 
 
 
@@ -108,5 +129,18 @@ class TourPackageBid(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Fields clients may select with `?fields=` (see utils.utils.get_sparse_fields).
+    API_FIELDS = (
+        'id', 'vehicle_type_id_id', 'tour_package_id_id', 'approved_proposal_id',
+        'vehicle_name', 'decided_price', 'seating_capacity', 'description', 'bid_status',
+        'proposal_approved_at', 'created_at', 'updated_at',
+    )
+
     class Meta:
-        db_table = "tour_package_bid"
\ No newline at end of file
+        db_table = "tour_package_bid"
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='tour_package_bid_cursor_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['tour_package_id'], name='tour_package_bid_package_unique'),
+        ]
\ No newline at end of file
@@ -1,9 +1,10 @@
 from django.urls import path
-from package_provider.views.daily_itinerary_view import DailyItineraryManagement
+from package_provider.views.daily_itinerary_view import DailyItineraryManagement, DailyItineraryBulkUpsert
 
 
 urlpatterns = [
     path('user/<uuid:user_id>/package/<uuid:package_id>', DailyItineraryManagement.as_view()),
+    path('user/<uuid:user_id>/package/<uuid:package_id>/bulk', DailyItineraryBulkUpsert.as_view()),
     path('user/<uuid:user_id>/itinerary/<uuid:itinerary_id>', DailyItineraryManagement.as_view())
 
 ]   
\ No newline at end of file
@@ -1,7 +1,8 @@
 from django.urls import path
-from package_provider.views.package_provider_view import PackageProvider
+from package_provider.views.package_provider_view import PackageProvider, PackageProviderBulk
 
 
 urlpatterns = [
     path('create/<uuid:user_id>', PackageProvider.as_view()),
+    path('create/<uuid:user_id>/bulk', PackageProviderBulk.as_view()),
 ]
\ No newline at end of file
@@ -0,0 +1,24 @@
+from django.db import transaction
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+from package_provider.models import TourPackage, DailyItinerary
+from utils.response_cache import (bump_versions, package_version_key, user_packages_version_key,
+                                  package_itineraries_version_key, itinerary_version_key)
+
+
+@receiver([post_save, post_delete], sender=TourPackage, dispatch_uid='tour_package_response_cache_invalidation')
+def invalidate_tour_package_responses(sender, instance, **kwargs):
+    """
+    Invalidates the cached package detail and the cached package list of its owner.
+    """
+    version_keys = (package_version_key(instance.id), user_packages_version_key(instance.user_id_id))
+    transaction.on_commit(lambda: bump_versions(*version_keys))
+
+
+@receiver([post_save, post_delete], sender=DailyItinerary, dispatch_uid='itinerary_response_cache_invalidation')
+def invalidate_itinerary_responses(sender, instance, **kwargs):
+    """
+    Invalidates the cached itinerary detail and the cached itinerary list of its package.
+    """
+    version_keys = (itinerary_version_key(instance.id), package_itineraries_version_key(instance.package_id_id))
+    transaction.on_commit(lambda: bump_versions(*version_keys))
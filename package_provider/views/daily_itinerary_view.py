@@ -1,11 +1,16 @@
 import uuid
 
+from django.db import transaction
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 from package_provider.models import DailyItinerary, TourPackage
 from package_provider.serializer.daily_itinerary_serializer import DailyItinerarySerializer
-from utils.utils import  get_user_by_id, validate_package_provider_roles, check_permissions, create_response, update_record
+from utils.utils import (validate_package_provider_roles, check_permissions, create_response, create_list_response, update_record, get_sparse_fields,
+                        get_validator, not_modified_response, set_validator_headers)
+from utils.response_cache import (get_cached_response, cache_response, package_itineraries_version_key, 
+                                  itinerary_version_key, bump_versions)
 
 class DailyItineraryManagement(APIView):
 
@@ -37,8 +42,16 @@ class DailyItineraryManagement(APIView):
         """
 
         try:
+            fields, error_message = get_sparse_fields(request, DailyItinerary)
 
-            user = get_user_by_id(user_id=user_id)
+            if error_message:
+                return create_response(
+                    success=False,
+                    message=error_message,
+                    status=400
+                )
+
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -58,28 +71,44 @@ class DailyItineraryManagement(APIView):
                 return permission
 
             if package_id:
+                cached, cache_key = get_cached_response(request, 'package_itineraries', package_itineraries_version_key(package_id))
+
+                if cached:
+                    return cached
 
-                itinerary_list = DailyItinerary.objects.filter(package_id=package_id).values().all()
+                itinerary_list = DailyItinerary.objects.filter(package_id=package_id).values(*fields).all()
+                validator = get_validator(request, itinerary_list, many=True)
 
-                if not itinerary_list:
+                if not validator['count']:
                     return create_response(
                         success=False,
                         message='Itinerary not found',
                         data=[],
                         status=404
                     )
-                
-                return create_response(
-                    success=True,
+
+                not_modified = not_modified_response(request, validator)
+
+                if not_modified:
+                    return not_modified
+
+                response = create_list_response(
+                    request,
                     message='Retrieved itinerary.',
-                    data=list(itinerary_list),
-                    status=200
+                    queryset=itinerary_list
                 )
+                return cache_response(cache_key, set_validator_headers(response, validator), validator['last_modified'])
 
             else:
-                itinerary = DailyItinerary.objects.filter(id=itinerary_id).values().first()
+                cached, cache_key = get_cached_response(request, 'itinerary', itinerary_version_key(itinerary_id))
+
+                if cached:
+                    return cached
 
-                if not itinerary:
+                itinerary = DailyItinerary.objects.filter(id=itinerary_id).values(*fields)
+                validator = get_validator(request, itinerary)
+
+                if not validator['count']:
                     return create_response(
                         success=False,
                         message='Itinerary not found',
@@ -87,12 +116,18 @@ class DailyItineraryManagement(APIView):
                         status=404
                     )
 
-                return create_response(
+                not_modified = not_modified_response(request, validator)
+
+                if not_modified:
+                    return not_modified
+
+                response = create_response(
                     success=True,
                     message='Retrieved itineraries',
-                    data=itinerary,
+                    data=itinerary.first(),
                     status=200
                 )
+                return cache_response(cache_key, set_validator_headers(response, validator), validator['last_modified'])
 
         except:
             return create_response(
@@ -120,7 +155,7 @@ class DailyItineraryManagement(APIView):
         """
         
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
             package = TourPackage.objects.filter(id=package_id).first()
             
             if not user:
@@ -197,7 +232,7 @@ class DailyItineraryManagement(APIView):
         """
         
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
             
             if not user:
                 return create_response(
@@ -275,7 +310,7 @@ class DailyItineraryManagement(APIView):
         
         try:
 
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
             
             if not user:
                 return create_response(
@@ -315,4 +350,204 @@ class DailyItineraryManagement(APIView):
                 success=False,
                 message='Something went wrong.',
                 status=500
-            )
\ No newline at end of file
+            )
+
+
+class DailyItineraryBulkUpsert(APIView):
+    """
+    APIView for creating or updating the whole itinerary of a tour package in one request.
+
+    Items are matched to existing itineraries of the package by `itinerary_day`:
+    matching itineraries are updated, the others are created. Creating needs the
+    `write` permission and updating the `update` permission. The request is
+    all-or-nothing; if any item is invalid nothing is written and the errors of
+    every invalid item are returned.
+    """
+
+    def post(self, request: Request, 
+            user_id: uuid.UUID,
+            package_id: uuid.UUID,
+        ) -> Response:
+        """
+        Upsert the daily itineraries of a package.
+
+        Args:
+            request (Request): The incoming HTTP request with a list of itineraries, either
+                as the body itself or under an `itineraries` key.
+            user_id (uuid.UUID): The ID of the user making the request.
+            package_id (uuid.UUID): The ID of the package the itineraries belong to.
+
+        Returns:
+            Response: A JSON response with the status of the operation.
+                - 200: Itineraries saved, with the number of created and updated itineraries.
+                - 400: Invalid payload, with the errors of each invalid item by index.
+                - 403: Permission denied, including updating existing itineraries without `update`.
+                - 404: User or package not found.
+                - 500: Internal server error.
+        """
+
+        try:
+            user = request.principal
+
+            if not user:
+                return create_response(
+                    success=False,
+                    message='User not found!',
+                    status=404
+                )
+            
+            validate_role = validate_package_provider_roles(user=user)
+
+            if validate_role:
+                return validate_role
+            
+            permission = check_permissions(user=user, permission_type='write')
+            
+            if permission:
+                return permission
+
+            items = request.data.get('itineraries') if isinstance(request.data, dict) else request.data
+
+            if not isinstance(items, list) or not items:
+                return create_response(
+                    success=False,
+                    message='A non-empty list of itineraries is required.',
+                    status=400
+                )
+
+            # Items are validated one by one so repeated days are compared on their
+            # validated values (e.g. "01" and 1 are the same day).
+            serializers = [DailyItinerarySerializer(data=item) for item in items]
+            errors = [{} if serializer.is_valid() else serializer.errors for serializer in serializers]
+            first_index_of_day = {}
+
+            for index, serializer in enumerate(serializers):
+                if errors[index]:
+                    continue
+
+                day = serializer.validated_data['itinerary_day']
+
+                if day in first_index_of_day:
+                    errors[index] = {'itinerary_day': ['Itinerary day is repeated in the request.']}
+                else:
+                    first_index_of_day[day] = index
+
+            item_errors = [
+                {'index': index, 'errors': error}
+                for index, error in enumerate(errors) if error
+            ]
+
+            if item_errors:
+                return create_response(
+                    success=False,
+                    message='Some itineraries are invalid.',
+                    data={'errors': item_errors},
+                    status=400
+                )
+
+            update_permission = check_permissions(user=user, permission_type='update')
+
+            try:
+                created, updated = upsert_itineraries(
+                    package_id,
+                    user_id,
+                    [serializer.validated_data for serializer in serializers],
+                    allow_update=not update_permission
+                )
+            except ItineraryUpdateDenied:
+                return update_permission
+
+            if created is None:
+                return create_response(
+                    success=False,
+                    message='Package not found.',
+                    status=404
+                )
+
+            return create_response(
+                success=True,
+                message='Itineraries saved.',
+                data={'created': created, 'updated': updated},
+                status=200
+            )
+
+        except:
+            return create_response(
+                success=False,
+                message='Something went wrong.',
+                status=500
+            )
+
+
+
+class ItineraryUpdateDenied(Exception):
+    """
+    Raised by `upsert_itineraries` when items match existing itineraries but updates are not allowed.
+    """
+
+
+def upsert_itineraries(package_id: uuid.UUID, user_id: uuid.UUID, items: list, allow_update: bool = True):
+    """
+    Creates or updates the itineraries of a package, keyed on `itinerary_day`, in one transaction.
+
+    The package row is locked for the duration of the transaction so concurrent bulk
+    requests for the same package cannot create the same day twice. Bulk writes do
+    not send model signals, so the cached itinerary responses are invalidated here.
+
+    Args:
+        package_id (uuid.UUID): The ID of the package.
+        user_id (uuid.UUID): The ID of the package owner.
+        items (list): Validated itinerary data, one dict per itinerary.
+        allow_update (bool, optional): Whether existing itineraries may be overwritten.
+
+    Returns:
+        tuple:
+            - (int or None): The number of created itineraries, or None if the user has no such package.
+            - (int): The number of updated itineraries.
+
+    Raises:
+        ItineraryUpdateDenied: If an item matches an existing itinerary and `allow_update` is False.
+            Nothing is written.
+    """
+    with transaction.atomic():
+        if not TourPackage.objects.select_for_update().filter(id=package_id, user_id=user_id).exists():
+            return None, 0
+
+        existing = {
+            itinerary.itinerary_day: itinerary
+            for itinerary in DailyItinerary.objects.filter(
+                package_id=package_id, itinerary_day__in=[item['itinerary_day'] for item in items]
+            )
+        }
+
+        if existing and not allow_update:
+            raise ItineraryUpdateDenied()
+
+        now = timezone.now()
+        to_create, to_update = [], []
+        update_fields = {'updated_at'}
+
+        for item in items:
+            itinerary = existing.get(item['itinerary_day'])
+
+            if itinerary is None:
+                to_create.append(DailyItinerary(package_id_id=package_id, **item))
+                continue
+
+            for field, value in item.items():
+                setattr(itinerary, field, value)
+
+            itinerary.updated_at = now
+            update_fields.update(item)
+            to_update.append(itinerary)
+
+        DailyItinerary.objects.bulk_create(to_create, batch_size=500)
+
+        if to_update:
+            DailyItinerary.objects.bulk_update(to_update, sorted(update_fields), batch_size=500)
+
+        version_keys = [package_itineraries_version_key(package_id)]
+        version_keys += [itinerary_version_key(itinerary.id) for itinerary in to_update]
+        transaction.on_commit(lambda: bump_versions(*version_keys))
+
+    return len(to_create), len(to_update)
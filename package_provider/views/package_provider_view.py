@@ -1,9 +1,10 @@
 import uuid
-from common_app.models import User
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 from users.serializer.register_serializer import UserRegistrationSerializer 
+from utils.bulk_import import get_import_format, iter_rows
+from utils.user_provisioning import provision_users
 from utils.utils import create_response, create_user, validate_package_provider_roles
 
 class PackageProvider(APIView):
@@ -39,7 +40,7 @@ class PackageProvider(APIView):
             - HTTP 500: Unexpected error during registration.
         """
         try:
-            creator = User.objects.filter(id=user_id).first()
+            creator = request.principal
 
             if not creator:
                 return create_response(
@@ -81,5 +82,80 @@ class PackageProvider(APIView):
                 message="Something went wrong!",
                 status=500
             )
-        
 
+
+
+class PackageProviderBulk(APIView):
+    """
+    API view to provision many package providers at once from a CSV or NDJSON file.
+
+    The creator must have the role of `package_admin`. Each row is validated like a
+    single registration; valid rows are created even if other rows fail.
+    """
+    def post(self, request: Request, 
+            user_id: uuid.UUID
+        ) -> Response:
+        """
+        Handles POST requests for bulk package provider registration.
+
+        Args:
+            request (Request): The multipart request with the file under `file`. The format is
+                taken from `input_format` (`csv` or `ndjson`) or the file extension.
+            user_id (uuid.UUID): The UUID of the user initiating the creation request, 
+            who must have a `package_admin` role.
+
+        Returns:
+            Response: A JSON response with a status code and message.
+            - HTTP 200: Import done, with the created and failed counts and the errors of each failed row.
+            - HTTP 400: Missing file or unsupported format.
+            - HTTP 404: Creator not found or invalid role.
+            - HTTP 500: Unexpected error during registration.
+        """
+        try:
+            creator = request.principal
+
+            if not creator:
+                return create_response(
+                    success=False,  
+                    message='Creator not found.',
+                    status=404
+                )
+
+            validate_role = validate_package_provider_roles(creator, role_list=['package_admin'])
+
+            if validate_role:
+                return validate_role
+
+            upload = request.FILES.get('file')
+
+            if not upload:
+                return create_response(
+                    success=False,
+                    message='File is required.',
+                    status=400
+                )
+
+            file_format = get_import_format(upload.name, request.data.get('input_format'))
+
+            if file_format not in ('csv', 'ndjson'):
+                return create_response(
+                    success=False,
+                    message='Input format must be csv or ndjson.',
+                    status=400
+                )
+
+            report = provision_users(creator.id, iter_rows(upload.file, file_format))
+
+            return create_response(
+                success=True,
+                message='Users imported.',
+                data=report,
+                status=200
+            )
+
+        except:
+            return create_response(
+                success=False,
+                message="Something went wrong!",
+                status=500
+            )
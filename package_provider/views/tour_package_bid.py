@@ -1,12 +1,21 @@
 import uuid
+from django.db import IntegrityError, transaction
 from django.utils.timezone import now
 from rest_framework.views import APIView
 from common_app.models import VehicleType
 from rest_framework.request import Request
 from rest_framework.response import Response
 from package_provider.models import TourPackageBid, TourPackage
-from utils.utils import create_response, validate_package_provider_roles, get_user_by_id, check_permissions, update_record
+from utils.utils import create_response, create_list_response, validate_package_provider_roles, check_permissions, update_record, get_sparse_fields
 from package_provider.serializer.tour_package_bid_serializer import TourPackageNecessitySerializer, TourPackageAcceptSerializer
+from utils.db import insert_ignoring_conflicts, get_violated_field
+
+
+MISSING_REFERENCE_MESSAGES = {
+    'vehicle_type_id': 'Vehicle type not found.',
+    'tour_package_id': 'Package not found.',
+}
+
 
 class TourPackageBidManagement(APIView):
     """
@@ -24,8 +33,16 @@ class TourPackageBidManagement(APIView):
             package_bid_id: uuid.UUID=None,
             ) -> Response:
         try:
+            fields, error_message = get_sparse_fields(request, TourPackageBid)
+
+            if error_message:
+                return create_response(
+                    success=False,
+                    message=error_message,
+                    status=400
+                )
 
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -45,7 +62,7 @@ class TourPackageBidManagement(APIView):
                 return validate_role
             
             if package_bid_id:
-                package_necessity = TourPackageBid.objects.filter(id=package_bid_id).values().first()
+                package_necessity = TourPackageBid.objects.filter(id=package_bid_id).values(*fields).first()
 
                 if not package_necessity:
                     return create_response(
@@ -64,9 +81,9 @@ class TourPackageBidManagement(APIView):
             
 
             else:
-                package_necessities = TourPackageBid.objects.values().all()
+                package_necessities = TourPackageBid.objects.values(*fields).all()
 
-                if not package_necessities:
+                if not package_necessities.exists():
                     return create_response(
                         success=False,
                         message="Package requirement not found.",
@@ -74,11 +91,10 @@ class TourPackageBidManagement(APIView):
                         status=404
                     )
                 
-                return create_response(
-                    success=True,
+                return create_list_response(
+                    request,
                     message='Retrieved Packages requirement successfully.',
-                    data=list(package_necessities),
-                    status=200
+                    queryset=package_necessities
                 )
 
         except:
@@ -94,7 +110,7 @@ class TourPackageBidManagement(APIView):
             user_id: uuid.UUID,
         ) -> Response:
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -132,19 +148,34 @@ class TourPackageBidManagement(APIView):
                         status=404
                     )
 
-                validate_bidding = TourPackageBid.objects.filter(tour_package_id=validated_data['tour_package_id']).first()
+                # One statement: the unique constraint on tour_package_id rejects a second
+                # requirement for the package, and the foreign keys reject unknown ids.
+                fields = dict(validated_data)
+                package_bid = TourPackageBid(
+                    vehicle_type_id_id=fields.pop('vehicle_type_id'),
+                    tour_package_id_id=fields.pop('tour_package_id'),
+                    **fields
+                )
+
+                try:
+                    with transaction.atomic():
+                        created = insert_ignoring_conflicts(package_bid, ['tour_package_id'])
+
+                except IntegrityError as error:
+                    field = get_violated_field(error, ('vehicle_type_id', 'tour_package_id'))
+                    return create_response(
+                        success=False,
+                        message=MISSING_REFERENCE_MESSAGES.get(field, 'Package or vehicle type not found.'),
+                        status=404
+                    )
 
-                if validate_bidding:
+                if not created:
                     return create_response(
                         success=False,
                         message='Package requirement already exist',
                         status=409
                     )
-                
-                validated_data['vehicle_type_id'] = VehicleType.objects.filter(id=validated_data['vehicle_type_id']).first()
-                validated_data['tour_package_id'] = TourPackage.objects.filter(id=validated_data['tour_package_id']).first()
-                
-                TourPackageBid.objects.create(**validated_data)
+
                 return create_response(
                     success=True,
                     message='Package requirement create.',
@@ -174,7 +205,7 @@ class TourPackageBidManagement(APIView):
             user_id: uuid.UUID
         ) -> Response :
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -214,8 +245,18 @@ class TourPackageBidManagement(APIView):
                     )
                 
                 update_record(TourPackageNecessityObject, validated_data)
-                
-                TourPackageNecessityObject.save()
+
+                try:
+                    with transaction.atomic():
+                        TourPackageNecessityObject.save()
+
+                except IntegrityError:
+                    return create_response(
+                        success=False,
+                        message='Package requirement already exist',
+                        status=409
+                    )
+
                 return create_response(
                     success=True,
                     message='Package requirement update.',
@@ -245,7 +286,7 @@ class TourPackageBidManagement(APIView):
             user_id: uuid.UUID
         ) -> Response :
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -297,7 +338,7 @@ class TourPackageAccept(APIView):
         ):
         
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
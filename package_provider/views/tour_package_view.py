@@ -5,7 +5,9 @@ from rest_framework.response import Response
 from package_provider.models import TourPackage
 from common_app.models import User, Permission, Role
 from package_provider.serializer.tour_serializer import TourPackageSerializer
-from utils.utils import create_response, get_user_by_id, update_record, check_permissions, validate_package_provider_roles
+from utils.utils import (create_response, create_list_response, update_record, check_permissions, validate_package_provider_roles, get_sparse_fields,
+                        get_validator, not_modified_response, set_validator_headers)
+from utils.response_cache import get_cached_response, cache_response, package_version_key, user_packages_version_key
 
 class TourPackageManagement(APIView):
     """
@@ -38,7 +40,16 @@ class TourPackageManagement(APIView):
         """
 
         try:
-            user = get_user_by_id(user_id=user_id)
+            fields, error_message = get_sparse_fields(request, TourPackage)
+
+            if error_message:
+                return create_response(
+                    success=False,
+                    message=error_message,
+                    status=400
+                )
+
+            user = request.principal
             validate_role = validate_package_provider_roles(user=user)
 
             if validate_role:
@@ -50,41 +61,63 @@ class TourPackageManagement(APIView):
                 return permission     
 
             if package_id:
-                package = TourPackage.objects.filter(id=package_id).values().first()
+                cached, cache_key = get_cached_response(request, 'tour_package', package_version_key(package_id))
 
-                if not package:
+                if cached:
+                    return cached
+
+                package = TourPackage.objects.filter(id=package_id).values(*fields)
+                validator = get_validator(request, package)
+
+                if not validator['count']:
                     return create_response(
                         success=False,
                         message='Package not found.',
                         data=[],
                         status=404
                     )
-                
-                
-                return create_response (
+
+                not_modified = not_modified_response(request, validator)
+
+                if not_modified:
+                    return not_modified
+
+                response = create_response (
                     success=True,
                     message='Retrieved successfully.',
-                    data=package,
+                    data=package.first(),
                     status=200
                 )
+                return cache_response(cache_key, set_validator_headers(response, validator), validator['last_modified'])
 
             else:
-                user_packages = TourPackage.objects.filter(user_id=user_id).values().all() 
+                cached, cache_key = get_cached_response(request, 'user_packages', user_packages_version_key(user_id))
+
+                if cached:
+                    return cached
 
-                if not user_packages:
+                user_packages = TourPackage.objects.filter(user_id=user_id).values(*fields).all() 
+                validator = get_validator(request, user_packages, many=True)
+
+                if not validator['count']:
                     return create_response(
                         success=False,
                         message='No package associated with this user.',
                         data=[],
                         status=404
                     )
-                
-                return create_response(
-                    success=True,
+
+                not_modified = not_modified_response(request, validator)
+
+                if not_modified:
+                    return not_modified
+
+                response = create_list_response(
+                    request,
                     message='Retrieved packages successfully.',
-                    data=list(user_packages),
-                    status=200
+                    queryset=user_packages
                 )
+                return cache_response(cache_key, set_validator_headers(response, validator), validator['last_modified'])
 
         except:
             return create_response(
@@ -115,7 +148,7 @@ class TourPackageManagement(APIView):
         """
         
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
             
             if not user:
                 return create_response(
@@ -197,7 +230,7 @@ class TourPackageManagement(APIView):
 
         try:
             package = TourPackage.objects.filter(id=package_id, user_id=user_id).first()
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
             
             if not package:
                 return create_response(
@@ -277,7 +310,7 @@ class TourPackageManagement(APIView):
 
         try:
             package = TourPackage.objects.filter(id=package_id, user_id=user_id).first()
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not package:
                 return create_response(
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-17 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0030_list_cursor_indexes'),
+        ('travel_agency', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transportvehicle',
+            index=models.Index(fields=['user_id', 'created_at', 'id'], name='vehicle_user_cursor_idx'),
+        ),
+    ]
@@ -39,5 +39,17 @@ class TransportVehicle(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Fields clients may select with `?fields=` (see utils.utils.get_sparse_fields).
+    API_FIELDS = (
+        'id', 'user_id_id', 'owner_name', 'owner_phone_no', 'brand', 'model',
+        'seating_capacity', 'vehicle_identity_number', 'vehicle_type', 'vehicle_category',
+        'fuel_type', 'registration_number', 'insurance_policy_number', 'insurance_provider',
+        'insurance_start_date', 'insurance_end_date', 'insurance_coverage_details', 'is_active',
+        'created_at', 'updated_at',
+    )
+
     class Meta:
-        db_table = 'transport_vehicle'
\ No newline at end of file
+        db_table = 'transport_vehicle'
+        indexes = [
+            models.Index(fields=['user_id', 'created_at', 'id'], name='vehicle_user_cursor_idx'),
+        ]
\ No newline at end of file
@@ -1,8 +1,9 @@
 from django.urls import path
-from travel_agency.views.transport_vehicle_view import TransportVehicleManagement
+from travel_agency.views.transport_vehicle_view import TransportVehicleManagement, TransportVehicleImport
 
 
 urlpatterns = [
     path('user/<uuid:user_id>', TransportVehicleManagement.as_view(), name='add_transport_vehicle'),
     path('user/<uuid:user_id>/vehicle/<uuid:transport_vehicle_id>', TransportVehicleManagement.as_view(), name='manage_transport_vehicle'),
+    path('user/<uuid:user_id>/import', TransportVehicleImport.as_view(), name='import_transport_vehicles'),
 ]
\ No newline at end of file
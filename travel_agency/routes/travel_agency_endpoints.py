@@ -1,7 +1,8 @@
 from django.urls import path
-from travel_agency.views.travel_agency_view import TravelAgency
+from travel_agency.views.travel_agency_view import TravelAgency, TravelAgencyBulk
 
 
 urlpatterns = [
     path('create/<uuid:user_id>', TravelAgency.as_view()),
+    path('create/<uuid:user_id>/bulk', TravelAgencyBulk.as_view()),
 ]
\ No newline at end of file
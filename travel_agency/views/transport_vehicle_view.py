@@ -5,7 +5,10 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from travel_agency.models import TransportVehicle
 from travel_agency.serializer.transport_vehicle_serializer import TransportVehicleSerializer
-from utils.utils import create_response, get_user_by_id, update_record, validate_travel_agency_roles, check_permissions
+from utils.bulk_import import get_import_format, iter_rows
+from utils.vehicle_import import import_transport_vehicles
+from utils.utils import (create_response, create_list_response, update_record, validate_travel_agency_roles, check_permissions, get_sparse_fields,
+                        get_validator, not_modified_response, set_validator_headers)
 
 class TransportVehicleManagement(APIView): 
 
@@ -40,8 +43,16 @@ class TransportVehicleManagement(APIView):
         """
 
         try:
+            fields, error_message = get_sparse_fields(request, TransportVehicle)
 
-            user = get_user_by_id(user_id=user_id)
+            if error_message:
+                return create_response(
+                    success=False,
+                    message=error_message,
+                    status=400
+                )
+
+            user = request.principal
             validate_role = validate_travel_agency_roles(user=user)
 
             if validate_role:
@@ -53,40 +64,53 @@ class TransportVehicleManagement(APIView):
                 return permission
             
             if transport_vehicle_id:
-                transport_vehicle = TransportVehicle.objects.filter(id=transport_vehicle_id).values().first()
+                transport_vehicle = TransportVehicle.objects.filter(id=transport_vehicle_id).values(*fields)
+                validator = get_validator(request, transport_vehicle)
 
-                if not transport_vehicle:
+                if not validator['count']:
                     return create_response(
                         success=False,
                         message='Vehicle not found.',
                         data=[],
                         status=404
                     )
-                
-                return create_response(
+
+                not_modified = not_modified_response(request, validator)
+
+                if not_modified:
+                    return not_modified
+
+                response = create_response(
                     success=True,
                     message='Retrieved successfully.',
-                    data=transport_vehicle,
+                    data=transport_vehicle.first(),
                     status=200
                 )
+                return set_validator_headers(response, validator)
             
             else:
-                transport_vehicle_list = TransportVehicle.objects.filter(user_id=user_id).values().all()
+                transport_vehicle_list = TransportVehicle.objects.filter(user_id=user_id).values(*fields).all()
+                validator = get_validator(request, transport_vehicle_list, many=True)
 
-                if not transport_vehicle_list:
+                if not validator['count']:
                     return create_response(
                         success=False,
                         message='Vehicle not found.',
                         data=[],
                         status=404
                     )
-                
-                return create_response(
-                    success=True,
+
+                not_modified = not_modified_response(request, validator)
+
+                if not_modified:
+                    return not_modified
+
+                response = create_list_response(
+                    request,
                     message='Retrieved Vehicles successfully.',
-                    data=list(transport_vehicle_list),
-                    status=200
+                    queryset=transport_vehicle_list
                 )
+                return set_validator_headers(response, validator)
 
         except:
             return create_response(
@@ -116,7 +140,7 @@ class TransportVehicleManagement(APIView):
         """
 
         try:
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not user:
                 return create_response(
@@ -198,7 +222,7 @@ class TransportVehicleManagement(APIView):
 
         try:
             transport_vehicle = TransportVehicle.objects.filter(id=transport_vehicle_id).first()
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not transport_vehicle:
                 return create_response(
@@ -276,7 +300,7 @@ class TransportVehicleManagement(APIView):
 
         try:
             transport_vehicle = TransportVehicle.objects.filter(id=transport_vehicle_id).first()
-            user = get_user_by_id(user_id=user_id)
+            user = request.principal
 
             if not transport_vehicle:
                 return create_response(
@@ -307,4 +331,88 @@ class TransportVehicleManagement(APIView):
                 success=False,
                 message="Something went wrong!",
                 status=500
-            )
\ No newline at end of file
+            )
+
+
+class TransportVehicleImport(APIView):
+    """
+    APIView for importing a fleet of transport vehicles from a CSV or NDJSON file.
+    """
+
+    def post(self, request: Request, 
+            user_id: uuid.UUID,
+        ) -> Response:
+
+        """
+        Import transport vehicles from an uploaded file.
+
+        The file is read row by row and imported in chunks (see
+        `utils.vehicle_import.import_transport_vehicles`); valid rows are created
+        even if other rows fail.
+
+        Args:
+            request (Request): The multipart request with the file under `file`. The
+                format is taken from `input_format` (`csv` or `ndjson`) or the file extension.
+            user_id (uuid.UUID): The ID of the user importing the vehicles.
+
+        Returns:
+            Response: 
+                - 200: Import done, with the created and failed counts and the errors of each failed row.
+                - 400: Missing file or unsupported format.
+                - 404: User not found.
+                - 500: Internal server error.
+        """
+
+        try:
+            user = request.principal
+
+            if not user:
+                return create_response(
+                    success=False,
+                    message='User not found.',
+                    status=404
+                )
+            
+            validate_role = validate_travel_agency_roles(user=user)
+
+            if validate_role:
+                return validate_role
+            
+            permission = check_permissions(user=user, permission_type='write')
+            
+            if permission:
+                return permission
+
+            upload = request.FILES.get('file')
+
+            if not upload:
+                return create_response(
+                    success=False,
+                    message='File is required.',
+                    status=400
+                )
+
+            file_format = get_import_format(upload.name, request.data.get('input_format'))
+
+            if file_format not in ('csv', 'ndjson'):
+                return create_response(
+                    success=False,
+                    message='Input format must be csv or ndjson.',
+                    status=400
+                )
+
+            report = import_transport_vehicles(user.id, iter_rows(upload.file, file_format))
+
+            return create_response(
+                success=True,
+                message='Vehicles imported.',
+                data=report,
+                status=200
+            )
+
+        except:
+            return create_response(
+                success=False,
+                message="Something went wrong!",
+                status=500
+            )
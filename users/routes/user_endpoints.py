@@ -1,5 +1,5 @@
 from django.urls import path
-from users.views.user_view import Register, Login, UserManagement
+from users.views.user_view import Register, Login, TokenRefresh, UserManagement
 
 
 urlpatterns = [
@@ -12,6 +12,7 @@ urlpatterns = [
     #----Login-----
     path('user/login/', Login.as_view(), name='user_login'),
     path('user/validate/otp/<uuid:user_id>', Login.as_view(), name='user_login'),
+    path('user/token/refresh/', TokenRefresh.as_view(), name='user_token_refresh'),
 
 
     #----Manage Users-----
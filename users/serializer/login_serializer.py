@@ -62,3 +62,19 @@ class UserLoginSerializer(serializers.Serializer):
             raise serializers.ValidationError({'otp_input': 'OTP must be exactly 6 digits.'})
 
         return data
+
+
+
+class TokenRefreshSerializer(serializers.Serializer):
+    """
+    Serializer for exchanging a refresh token for a new access token.
+    """
+
+    refresh_token = serializers.CharField(
+        max_length=255,
+        error_messages={
+            'max_length': 'Refresh token must not exceed 255 characters.',
+            'required': 'Refresh token is required.',
+            'blank': 'Refresh token field may not be blank.',
+        }
+    )
@@ -4,7 +4,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from common_app.models import User, User_Address
 from users.serializer.address_serializer import AddressSerializer
-from utils.utils import (create_response, is_user_id_exist, 
+from utils.utils import (create_response, create_list_response, is_user_id_exist, 
                         fetch_address_details, get_address_by_id, 
                         update_record, check_permissions, get_user_by_id)
 
@@ -64,7 +64,7 @@ class Addresses(APIView):
             elif user_id:
                 addresses = fetch_address_details(user_id=user_id)
                 
-                if len(addresses) <= 0:
+                if not addresses.exists():
                     return create_response(
                         success=False,     
                         message='No address associate with this user.',
@@ -72,17 +72,16 @@ class Addresses(APIView):
                         status=404  
                     )
 
-                return create_response(
-                    success=True,     
+                return create_list_response(
+                    request,
                     message='Retrieved Addresses successfully.',
-                    data=list(addresses),
-                    status=200,
+                    queryset=addresses
                 )
             
             else:
                 addresses = fetch_address_details()
                 
-                if len(addresses) <= 0:
+                if not addresses.exists():
                     return create_response(
                         success=False,     
                         message='No address associate with this user.',
@@ -90,11 +89,11 @@ class Addresses(APIView):
                         status=404
                     )
 
-                return create_response(
-                    success=True,     
+                return create_list_response(
+                    request,
                     message='Retrieved all Addresses successfully.',
-                    data=list(addresses),
-                    status=200,
+                    queryset=addresses,
+                    stream=True
                 )
             
             
@@ -3,7 +3,7 @@ from common_app.models import Company
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
-from utils.utils import create_response, get_user_by_id
+from utils.utils import create_response, create_list_response, get_user_by_id, get_sparse_fields
 from users.serializer.company_serializer import CompanySerializer
 
 class CompanyManagement(APIView):
@@ -43,9 +43,18 @@ class CompanyManagement(APIView):
             - HTTP 500: Internal server error.
         """
         try:
+            fields, error_message = get_sparse_fields(request, Company)
+
+            if error_message:
+                return create_response(
+                    success=False,
+                    message=error_message,
+                    status=400
+                )
+
             
             if company_id:
-                company = Company.objects.filter(id=company_id).values().first()
+                company = Company.objects.filter(id=company_id).values(*fields).first()
 
                 if not company:
                     return create_response(
@@ -73,9 +82,9 @@ class CompanyManagement(APIView):
                         status=404
                     )
                 
-                user_company = Company.objects.filter(user_id=user_id).values().all()
+                user_company = Company.objects.filter(user_id=user_id).values(*fields).all()
 
-                if not user_company:
+                if not user_company.exists():
                     return create_response(
                         success=False,
                         message='Company not found.',
@@ -83,17 +92,16 @@ class CompanyManagement(APIView):
                         status=404
                     )
                 
-                return create_response(
-                    success=True,
+                return create_list_response(
+                    request,
                     message='Retrieved companies successfully.',
-                    data=list(user_company),
-                    status=200
+                    queryset=user_company
                 )
             
             else:
-                companies = Company.objects.values().all()
+                companies = Company.objects.values(*fields).all()
 
-                if not companies:
+                if not companies.exists():
                     return create_response(
                         success=False,
                         message='Company not found.',
@@ -101,11 +109,11 @@ class CompanyManagement(APIView):
                         status=404
                     )
                 
-                return create_response(
-                    success=True,
+                return create_list_response(
+                    request,
                     message='Retrieved all company successfully.',
-                    data=list(companies),
-                    status=200
+                    queryset=companies,
+                    stream=True
                 )
 
         except Exception:
@@ -5,7 +5,7 @@ from common_app.models import User
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
-from users.serializer.login_serializer import UserLoginSerializer
+from users.serializer.login_serializer import UserLoginSerializer, TokenRefreshSerializer
 from users.serializer.register_serializer import UserRegistrationSerializer, UserUpdateSerializer
 
 
@@ -19,6 +19,9 @@ class Register(APIView):
     a new user in the database.
 
     """
+
+    # Public endpoint: a stale access token the client still sends must not reject the request.
+    authentication_classes = []
     
     def post(self, request: Request) -> Response:
         """
@@ -88,6 +91,9 @@ class Login(APIView):
 
     """
 
+    # Public endpoint: a client whose access token expired must still be able to log in again.
+    authentication_classes = []
+
     def post(self, request: Request, 
             user_id: uuid.UUID = None
         ) -> Response:
@@ -110,12 +116,21 @@ class Login(APIView):
             Response: A JSON response with a status code and message.
             - HTTP 200: Successful login or OTP sent.
             - HTTP 400: Invalid or missing phone number.
+            - HTTP 429: Too many OTP requests or attempts for the phone number, user or client IP.
             - HTTP 500: Unexpected error during login or OTP generation.
         """
         try:
 
             if user_id:
 
+                rate_limited = enforce_rate_limits(
+                    ('otp_verify_user', str(user_id)),
+                    ('otp_verify_ip', get_client_ip(request))
+                )
+
+                if rate_limited:
+                    return rate_limited
+
                 user = get_user_by_id(user_id=user_id)
                 
                 if not user:
@@ -150,6 +165,7 @@ class Login(APIView):
                     "user_id": user.id,
                     "token_type": access_token.token_type,
                     "access_token": access_token.access_token,
+                    "refresh_token": access_token.refresh_token,
                     "expires_in": access_token.expires_at.strftime('%Y-%m-%d %H:%M:%S')
                 }
 
@@ -168,6 +184,14 @@ class Login(APIView):
 
                 phone_no = form_data.get('phone_no')
                 country_code = form_data.get('country_code')
+
+                rate_limited = enforce_rate_limits(
+                    ('otp_send_phone', f"{country_code}{phone_no}"),
+                    ('otp_send_ip', get_client_ip(request))
+                )
+
+                if rate_limited:
+                    return rate_limited
                 
                 user = is_phone_number_exist(phone_no, country_code)
 
@@ -221,6 +245,81 @@ class Login(APIView):
             )
 
 
+class TokenRefresh(APIView):
+    """
+    A view that exchanges a refresh token for a new access token.
+
+    This lets clients renew an expired access token without going through the
+    OTP login again. Both tokens are rotated, so each refresh token works once.
+
+    """
+
+    # The expired access token a client may still send must not reject the request.
+    authentication_classes = []
+
+    def post(self, request: Request) -> Response:
+        """
+        Handles POST requests for token refresh.
+
+        This method:
+        - Validates the provided data using the `TokenRefreshSerializer`.
+        - Rotates the access and refresh tokens held by the refresh token.
+
+        Args:
+            request (Request): The HTTP request object containing the `refresh_token`.
+
+        Returns:
+            Response: A JSON response with a status code and message.
+            - HTTP 200: New tokens issued.
+            - HTTP 400: Missing or invalid refresh token field.
+            - HTTP 401: Unknown, expired or already used refresh token.
+            - HTTP 500: Unexpected error during token refresh.
+        """
+        try:
+            serializer = TokenRefreshSerializer(data=request.data)
+
+            if not serializer.is_valid():
+                _, error_details = next(iter(serializer.errors.items()))
+                error_message = error_details[0]
+
+                return create_response(
+                    success=False, 
+                    message=error_message, 
+                    status=400
+                )
+
+            access_token = refresh_access_token(serializer.validated_data['refresh_token'])
+
+            if not access_token:
+                return create_response(
+                    success=False, 
+                    message='Invalid or expired refresh token.', 
+                    status=401
+                )
+
+            data = {
+                "token_type": access_token.token_type,
+                "access_token": access_token.access_token,
+                "refresh_token": access_token.refresh_token,
+                "expires_in": access_token.expires_at.strftime('%Y-%m-%d %H:%M:%S')
+            }
+
+            return create_response(
+                success=True, 
+                message="Token refreshed successfully.", 
+                data=data, 
+                status=200
+            )
+
+        except Exception as e:
+            return create_response(
+                success=False, 
+                message='Something went wrong', 
+                status=500
+            )
+
+
+
 class UserManagement(APIView):
     """
     A view that handles CRUD operations for User objects.
@@ -274,11 +373,11 @@ class UserManagement(APIView):
             else:
                 users = retrieve_user_details(user_id=None)
                 
-                return create_response( 
-                        success=True, 
+                return create_list_response(
+                        request,
                         message="Retrieved users successfully.", 
-                        data=users,
-                        status=200,
+                        queryset=users,
+                        stream=True
                     )
 
         except Exception:
@@ -0,0 +1,251 @@
+import math
+import redis
+import logging
+import hashlib
+import threading
+
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from utils.redis_client import redis_client
+
+
+USER_CONTACTS_KEY = 'bloom:user_contacts'
+REBUILD_MARGIN_SECONDS = 60
+REBUILD_LOCK_SECONDS = 10 * 60
+
+logger = logging.getLogger(__name__)
+
+
+# Both scripts treat a missing key as "filter not built yet": lookups answer
+# "maybe" (2, so the caller can schedule a rebuild) and additions are dropped,
+# so a partially filled filter can never report a stored value as absent. The
+# filter is created by `rebuild`.
+_contains_script = redis_client.register_script("""
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 2
+end
+
+for index = 1, #ARGV do
+    if redis.call('GETBIT', KEYS[1], ARGV[index]) == 0 then
+        return 0
+    end
+end
+
+return 1
+""")
+
+_add_script = redis_client.register_script("""
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+
+for index = 1, #ARGV do
+    redis.call('SETBIT', KEYS[1], ARGV[index], 1)
+end
+
+return 1
+""")
+
+
+class BloomFilter:
+    """
+    A Bloom filter stored as a Redis bitmap.
+
+    `might_contain` never answers False for an added value, and answers True for
+    an absent value with a probability of about `error_rate` while the filter
+    holds fewer than `capacity` values. Removed values cannot be taken out, so
+    the filter should be rebuilt from the database from time to time.
+
+    Redis failures are reported as "maybe", so callers fall back to the database.
+    A failed addition deletes the filter, since it could otherwise report the
+    value as absent. The filter expires `max_age` seconds after each rebuild, which
+    bounds the damage of additions lost in any other way (e.g. a worker dying
+    after commit, or Redis restoring an older snapshot). `on_missing` is called
+    when a lookup finds no filter, typically to schedule a rebuild.
+    """
+
+    def __init__(self, key: str, capacity: int, error_rate: float, max_age: int, on_missing=None):
+        self.key = key
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.max_age = max_age
+        self.on_missing = on_missing
+
+
+    def _positions(self, value: str) -> list:
+        """
+        Returns the bit offsets of a value, using double hashing over one digest.
+        """
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big')
+        return [(first + index * second) % self.size for index in range(self.hash_count)]
+
+
+    def might_contain(self, value: str) -> bool:
+        try:
+            found = _contains_script(keys=[self.key], args=self._positions(value))
+        except redis.RedisError:
+            return True
+
+        if found == 2 and self.on_missing:
+            self.on_missing()
+
+        return bool(found)
+
+
+    def add(self, *values: str):
+        positions = [position for value in values for position in self._positions(value)]
+
+        if not positions:
+            return
+
+        try:
+            _add_script(keys=[self.key], args=positions)
+        except redis.RedisError:
+            self.discard()
+
+
+    def discard(self):
+        """
+        Deletes the filter, so lookups answer "maybe" until it is rebuilt.
+        """
+        try:
+            redis_client.delete(self.key)
+        except redis.RedisError:
+            logger.error('Could not discard Bloom filter %s after a failed addition', self.key)
+
+
+    def rebuild(self, values):
+        """
+        Replaces the filter with one holding exactly `values` and returns their number.
+
+        The bitmap is built in memory and swapped in with a RENAME, so lookups
+        keep using the previous filter until the new one is complete. The new
+        filter expires after `max_age` seconds.
+        """
+        bitmap = bytearray(math.ceil(self.size / 8))
+        count = 0
+
+        for value in values:
+            for position in self._positions(value):
+                bitmap[position // 8] |= 0x80 >> (position % 8)
+            count += 1
+
+        temporary_key = f"{self.key}:rebuild"
+        pipeline = redis_client.pipeline()
+        pipeline.set(temporary_key, bytes(bitmap), ex=self.max_age)
+        pipeline.rename(temporary_key, self.key)
+        pipeline.execute()
+
+        return count
+
+
+
+def schedule_user_contacts_rebuild():
+    """
+    Rebuilds the user filter in a background thread, unless another process already is.
+    """
+    try:
+        if not redis_client.set(f"{USER_CONTACTS_KEY}:lock", 1, nx=True, ex=REBUILD_LOCK_SECONDS):
+            return
+    except redis.RedisError:
+        return
+
+    threading.Thread(target=_rebuild_in_background, daemon=True).start()
+
+
+def _rebuild_in_background():
+    try:
+        rebuild_user_contacts_filter()
+    except Exception:
+        logger.exception('User Bloom filter rebuild failed')
+    finally:
+        connection.close()
+
+        try:
+            redis_client.delete(f"{USER_CONTACTS_KEY}:lock")
+        except redis.RedisError:
+            pass
+
+
+user_contacts_filter = BloomFilter(
+    USER_CONTACTS_KEY,
+    capacity=settings.USER_BLOOM_FILTER_CAPACITY,
+    error_rate=settings.USER_BLOOM_FILTER_ERROR_RATE,
+    max_age=settings.USER_BLOOM_FILTER_MAX_AGE,
+    on_missing=schedule_user_contacts_rebuild,
+)
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def normalize_phone_no(phone_no: str) -> str:
+    return ''.join(character for character in phone_no if character.isdigit())
+
+
+def _contact_values(email: str = None, phone_no: str = None) -> list:
+    values = []
+
+    if email:
+        values.append(f"email:{normalize_email(email)}")
+
+    if phone_no:
+        values.append(f"phone:{normalize_phone_no(phone_no)}")
+
+    return values
+
+
+def email_may_exist(email: str) -> bool:
+    """
+    Returns False when no user can have this email, True when the database must be asked.
+    """
+    if not email:
+        return True
+
+    return user_contacts_filter.might_contain(f"email:{normalize_email(email)}")
+
+
+def phone_no_may_exist(phone_no: str) -> bool:
+    """
+    Returns False when no user can have this phone number, True when the database must be asked.
+    """
+    if not phone_no:
+        return True
+
+    return user_contacts_filter.might_contain(f"phone:{normalize_phone_no(phone_no)}")
+
+
+def remember_user_contacts(*users):
+    """
+    Adds the emails and phone numbers of the given users to the filter.
+    """
+    user_contacts_filter.add(*[
+        value for user in users for value in _contact_values(email=user.email, phone_no=user.phone_no)
+    ])
+
+
+def rebuild_user_contacts_filter() -> int:
+    """
+    Rebuilds the filter from every user in the database and returns the number of
+    emails and phone numbers added.
+
+    Users saved while the rebuild runs are added to the old filter, which is about
+    to be replaced, so they are added again once the new filter is in place. The
+    margin covers users saved by transactions that had not committed yet when the
+    rebuild read the table.
+    """
+    from common_app.models import User
+
+    started = timezone.now() - timedelta(seconds=REBUILD_MARGIN_SECONDS)
+    users = User.objects.values_list('email', 'phone_no').iterator(chunk_size=5000)
+    count = user_contacts_filter.rebuild(
+        value for email, phone_no in users for value in _contact_values(email=email, phone_no=phone_no)
+    )
+
+    remember_user_contacts(*User.objects.filter(updated_at__gte=started).only('email', 'phone_no'))
+
+    return count
@@ -0,0 +1,48 @@
+import io
+import csv
+import json
+
+
+def get_import_format(filename: str, requested: str = None) -> str:
+    """
+    Returns `'csv'` or `'ndjson'`, from the requested format or else the file extension.
+    """
+    if requested:
+        return requested.lower()
+
+    return 'ndjson' if filename.lower().endswith(('.ndjson', '.jsonl')) else 'csv'
+
+
+def iter_rows(binary_stream, file_format: str):
+    """
+    Yields `(row_number, row)` pairs from a CSV or NDJSON byte stream, one line at a time.
+
+    CSV rows are keyed by the header line and empty cells are left out, so optional
+    columns can be blank. NDJSON lines that are not JSON objects yield `None`.
+    Blank lines are skipped; row numbers count data rows from 1.
+    """
+    text_stream = io.TextIOWrapper(binary_stream, encoding='utf-8-sig', newline='')
+
+    if file_format == 'csv':
+        for row_number, row in enumerate(csv.DictReader(text_stream), start=1):
+            yield row_number, {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key and value is not None and value.strip()
+            }
+        return
+
+    row_number = 0
+
+    for line in text_stream:
+        if not line.strip():
+            continue
+
+        row_number += 1
+
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+
+        yield row_number, row if isinstance(row, dict) else None
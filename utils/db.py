@@ -0,0 +1,74 @@
+from django.db import IntegrityError, connections, router
+
+
+def get_violated_field(error: IntegrityError, fields) -> str:
+    """
+    Tells which of `fields` an IntegrityError was raised for.
+
+    The constraint name reported by the database (e.g. `users_email_key`) is used
+    when available, otherwise the error message (e.g. SQLite's
+    `UNIQUE constraint failed: users.email`).
+
+    Args:
+        error (IntegrityError): The error raised by the failed write.
+        fields (iterable): Field names to look for, in order of priority.
+
+    Returns:
+        str or None: The first field named by the violated constraint, or None.
+    """
+    diag = getattr(error.__cause__, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None) or str(error)
+
+    for field in fields:
+        if field in constraint:
+            return field
+
+    return None
+
+
+def insert_ignoring_conflicts(instance, conflict_fields) -> bool:
+    """
+    Inserts a model instance unless a row with the same `conflict_fields` exists,
+    in a single `INSERT ... ON CONFLICT DO NOTHING RETURNING` statement.
+
+    Unlike check-then-insert, two concurrent callers cannot both insert: the
+    unique constraint on `conflict_fields` decides, and the loser is told so
+    instead of receiving an IntegrityError. Other constraint violations (e.g. a
+    foreign key to a missing row) still raise IntegrityError. No model signals
+    are sent. Needs PostgreSQL (or SQLite 3.35+ for RETURNING).
+
+    Args:
+        instance (Model): The unsaved instance; defaults and `auto_now` fields are
+            filled in as `save()` would.
+        conflict_fields (iterable): Field names covered by a unique constraint.
+
+    Returns:
+        bool: True if the row was inserted, False if it conflicted with an existing row.
+    """
+    model = type(instance)
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+
+    fields = model._meta.concrete_fields
+    columns = ', '.join(quote(field.column) for field in fields)
+    placeholders = ', '.join(['%s'] * len(fields))
+    conflict_columns = ', '.join(quote(model._meta.get_field(name).column) for name in conflict_fields)
+    params = [
+        field.get_db_prep_save(field.pre_save(instance, add=True), connection=connection)
+        for field in fields
+    ]
+
+    sql = (
+        f"INSERT INTO {quote(model._meta.db_table)} ({columns}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({conflict_columns}) DO NOTHING RETURNING {quote(model._meta.pk.column)}"
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        inserted = cursor.fetchone() is not None
+
+    if inserted:
+        instance._state.adding = False
+        instance._state.db = connection.alias
+
+    return inserted
@@ -0,0 +1,190 @@
+import uuid
+import redis
+
+from django.conf import settings
+from utils.local_cache import LRUCache
+from utils.redis_client import redis_client
+from utils.permission_cache import get_role_permissions
+
+
+_local_cache = LRUCache(
+    maxsize=settings.EFFECTIVE_PERMISSION_CACHE_LOCAL_SIZE,
+    ttl=settings.PERMISSION_CACHE_LOCAL_TTL,
+)
+
+
+def _redis_key(user_id) -> str:
+    return f"effective_permissions:{user_id}"
+
+
+def _grant_masks(user_ids) -> dict:
+    """
+    Returns the OR of the active `UserPermission` grants of each user.
+    """
+    from common_app.models import UserPermission
+
+    masks = {}
+    grants = UserPermission.objects.filter(user_id__in=user_ids, is_active=True).values_list(
+        'user_id', 'permission_mask'
+    )
+
+    for user_id, permission_mask in grants:
+        masks[user_id] = masks.get(user_id, 0) | permission_mask
+
+    return masks
+
+
+def _store(masks: dict):
+    """
+    Upserts `EffectivePermission` rows and writes them through to Redis.
+
+    If the Redis write fails, the users' cached masks are deleted so reads fall
+    through to the table; should that fail too, they still expire after
+    `settings.EFFECTIVE_PERMISSION_CACHE_TTL`.
+
+    Args:
+        masks (dict): A mapping of user ID to effective permission bitmask.
+    """
+    from common_app.models import EffectivePermission
+
+    if not masks:
+        return
+
+    EffectivePermission.objects.bulk_create(
+        [EffectivePermission(user_id_id=user_id, permission_mask=mask) for user_id, mask in masks.items()],
+        update_conflicts=True,
+        unique_fields=['user_id'],
+        update_fields=['permission_mask', 'updated_at'],
+        batch_size=1000,
+    )
+
+    for user_id in masks:
+        _local_cache.delete(str(user_id))
+
+    pipeline = redis_client.pipeline(transaction=False)
+
+    for user_id, mask in masks.items():
+        pipeline.setex(_redis_key(user_id), settings.EFFECTIVE_PERMISSION_CACHE_TTL, mask)
+
+    try:
+        pipeline.execute()
+    except redis.RedisError:
+        _forget_cached_masks(*masks)
+
+
+def _forget_cached_masks(*user_ids):
+    try:
+        redis_client.delete(*[_redis_key(user_id) for user_id in user_ids])
+    except redis.RedisError:
+        pass
+
+
+def refresh_user_permissions(*user_ids: uuid.UUID):
+    """
+    Recomputes the effective permissions of the given users.
+
+    Call this after a user's role or their `UserPermission` grants change.
+    """
+    from common_app.models import User
+
+    users = User.objects.filter(id__in=user_ids).values_list('id', 'role_id')
+    grant_masks = _grant_masks(user_ids)
+
+    _store({
+        user_id: get_role_permissions(role_id) | grant_masks.get(user_id, 0)
+        for user_id, role_id in users
+    })
+
+
+def seed_user_permissions(user_id: uuid.UUID, role_id: uuid.UUID):
+    """
+    Stores the effective permissions of a newly created user.
+
+    A new user has no `UserPermission` grants yet, so the bitmask is the role's
+    alone and no lookup of the user or their grants is needed.
+    """
+    _store({user_id: get_role_permissions(role_id)})
+
+
+def refresh_role_permissions(*role_ids: uuid.UUID):
+    """
+    Recomputes the effective permissions of every user holding one of the given roles.
+
+    Call this after the role's permissions changed; the role-permission cache
+    must already be invalidated so the new role bitmask is read.
+    """
+    from common_app.models import User
+
+    batch_size = 1000
+
+    for role_id in role_ids:
+        role_mask = get_role_permissions(role_id)
+        user_ids = User.objects.filter(role_id=role_id).values_list('id', flat=True).iterator(chunk_size=batch_size)
+        batch = []
+
+        for user_id in user_ids:
+            batch.append(user_id)
+
+            if len(batch) == batch_size:
+                grant_masks = _grant_masks(batch)
+                _store({user_id: role_mask | grant_masks.get(user_id, 0) for user_id in batch})
+                batch = []
+
+        if batch:
+            grant_masks = _grant_masks(batch)
+            _store({user_id: role_mask | grant_masks.get(user_id, 0) for user_id in batch})
+
+
+def forget_user_permissions(user_id: uuid.UUID):
+    """
+    Drops a deleted user from the effective permission caches.
+    """
+    _local_cache.delete(str(user_id))
+    _forget_cached_masks(user_id)
+
+
+def get_effective_permissions(user) -> int:
+    """
+    Returns the effective permission bitmask of a user.
+
+    Reads go through the in-process cache, then Redis, then the
+    `effective_permission` table. Users without a row yet (e.g. created before
+    the table existed) are computed and stored on first access.
+
+    Args:
+        user (User): The user whose permissions are requested.
+
+    Returns:
+        int: The permission bitmask (see `common_app.permission_bits`).
+    """
+    from common_app.models import EffectivePermission
+
+    key = str(user.id)
+    mask = _local_cache.get(key)
+
+    if mask is not None:
+        return mask
+
+    try:
+        cached = redis_client.get(_redis_key(key))
+    except redis.RedisError:
+        cached = None
+
+    if cached is not None:
+        mask = int(cached)
+
+    else:
+        mask = EffectivePermission.objects.filter(user_id=user.id).values_list('permission_mask', flat=True).first()
+
+        if mask is None:
+            mask = get_role_permissions(user.role_id_id) | _grant_masks([user.id]).get(user.id, 0)
+            _store({user.id: mask})
+
+        else:
+            try:
+                redis_client.setex(_redis_key(key), settings.EFFECTIVE_PERMISSION_CACHE_TTL, mask)
+            except redis.RedisError:
+                pass
+
+    _local_cache.set(key, mask)
+    return mask
@@ -0,0 +1,53 @@
+import json
+import datetime
+import decimal
+
+from django.conf import settings
+from django.utils.functional import Promise
+from django.utils.duration import duration_iso_string
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_default(obj):
+    """
+    Encodes the types orjson does not handle natively, the same way `DjangoJSONEncoder` does.
+    UUIDs, datetimes, dates and times are encoded natively by orjson.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+
+    if isinstance(obj, datetime.timedelta):
+        return duration_iso_string(obj)
+
+    if isinstance(obj, Promise):
+        return str(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _render_orjson(payload) -> bytes:
+    return orjson.dumps(payload, default=_orjson_default, option=orjson.OPT_UTC_Z)
+
+
+def _render_django(payload) -> bytes:
+    return json.dumps(payload, cls=DjangoJSONEncoder).encode()
+
+
+def get_renderer():
+    """
+    Returns the JSON renderer selected by `settings.JSON_RENDERER`.
+
+    `'orjson'` falls back to the standard library encoder when orjson is not installed.
+    """
+    if settings.JSON_RENDERER == 'orjson' and orjson is not None:
+        return _render_orjson
+
+    return _render_django
+
+
+render_json = get_renderer()
@@ -0,0 +1,145 @@
+import jwt
+import time
+import uuid
+import redis
+import threading
+
+from collections import namedtuple
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from utils.redis_client import redis_client
+from utils.effective_permissions import get_effective_permissions
+
+
+REVOKED_KEY = 'jwt:revoked'
+
+IssuedToken = namedtuple('IssuedToken', ['token_type', 'access_token', 'refresh_token', 'expires_at'])
+
+
+def issue_access_token(user):
+    """
+    Issues a short-lived signed access token for a user.
+
+    The token carries the user ID, role and effective permission bitmask, so it
+    can be verified and authorized without a database or Redis lookup.
+
+    Args:
+        user (User): The user the token is issued for, with its role loaded.
+
+    Returns:
+        tuple:
+            - (str): The encoded JWT.
+            - (str): The token ID (`jti`) used for revocation.
+            - (datetime): The expiry of the token.
+    """
+    issued_at = timezone.now()
+    expires_at = issued_at + timedelta(seconds=settings.JWT_ACCESS_TOKEN_LIFETIME)
+    jti = uuid.uuid4().hex
+
+    claims = {
+        'sub': str(user.id),
+        'role_id': str(user.role_id_id),
+        'role': user.role_id.name,
+        'perm': get_effective_permissions(user),
+        'jti': jti,
+        'iat': issued_at,
+        'exp': expires_at,
+    }
+
+    token = jwt.encode(claims, settings.JWT_SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
+    return token, jti, expires_at
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    Verifies the signature, expiry and revocation status of an access token.
+
+    Returns:
+        dict: The token claims.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid, expired or revoked.
+    """
+    claims = jwt.decode(
+        token,
+        settings.JWT_SIGNING_KEY,
+        algorithms=[settings.JWT_ALGORITHM],
+        options={'require': ['sub', 'jti', 'exp']}
+    )
+
+    if _revocation_list.contains(claims['jti']):
+        raise jwt.InvalidTokenError('Token has been revoked.')
+
+    return claims
+
+
+def looks_like_jwt(token: str) -> bool:
+    """
+    Tells signed access tokens apart from opaque ones without decoding them.
+    """
+    return token.count('.') == 2
+
+
+
+class RevocationList:
+    """
+    Revoked token IDs, stored in a Redis sorted set scored by token expiry.
+
+    Each process keeps a local snapshot that is refreshed at most every
+    `JWT_REVOCATION_REFRESH_INTERVAL` seconds, so verifying a token does not
+    hit Redis. Entries drop out once the token would have expired anyway,
+    which keeps the list small.
+    """
+
+    def __init__(self):
+        self._revoked = set()
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+
+    def add(self, jti: str, expires_at):
+        with self._lock:
+            self._revoked.add(jti)
+
+        try:
+            redis_client.zadd(REVOKED_KEY, {jti: expires_at.timestamp()})
+        except redis.RedisError:
+            pass
+
+
+    def contains(self, jti: str) -> bool:
+        now = time.monotonic()
+
+        if self._loaded_at is None or now - self._loaded_at > settings.JWT_REVOCATION_REFRESH_INTERVAL:
+            self._refresh(now)
+
+        return jti in self._revoked
+
+
+    def _refresh(self, now: float):
+        try:
+            redis_client.zremrangebyscore(REVOKED_KEY, '-inf', time.time())
+            revoked = set(redis_client.zrangebyscore(REVOKED_KEY, time.time(), '+inf'))
+        except redis.RedisError:
+            return
+
+        with self._lock:
+            self._revoked = revoked
+            self._loaded_at = now
+
+
+
+_revocation_list = RevocationList()
+
+
+def revoke_access_token(jti: str):
+    """
+    Revokes an access token by its token ID.
+
+    The expiry of the token is not stored server-side, so the entry is kept for
+    the full access token lifetime, which outlives any token with this ID.
+    """
+    if jti:
+        expires_at = timezone.now() + timedelta(seconds=settings.JWT_ACCESS_TOKEN_LIFETIME)
+        _revocation_list.add(jti, expires_at)
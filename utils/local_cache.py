@@ -0,0 +1,61 @@
+import time
+import threading
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    A small thread-safe, in-process LRU cache with a per-entry time to live.
+
+    Entries are evicted either when the cache grows beyond `maxsize` (least
+    recently used first) or when they are older than `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for `key`, or `default` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+
+    def set(self, key, value):
+        """
+        Stores `value` under `key`, evicting the least recently used entry if needed.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
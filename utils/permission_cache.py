@@ -0,0 +1,126 @@
+import uuid
+import redis
+
+from django.conf import settings
+from utils.local_cache import LRUCache
+from utils.redis_client import redis_client
+
+
+_local_cache = LRUCache(
+    maxsize=settings.PERMISSION_CACHE_LOCAL_SIZE,
+    ttl=settings.PERMISSION_CACHE_LOCAL_TTL,
+)
+
+_role_name_cache = LRUCache(
+    maxsize=settings.PERMISSION_CACHE_LOCAL_SIZE,
+    ttl=settings.PERMISSION_CACHE_LOCAL_TTL,
+)
+
+
+def _redis_key(role_id: uuid.UUID) -> str:
+    return f"role_permissions:{role_id}"
+
+
+def _load_role_permissions(role_id: uuid.UUID) -> int:
+    """
+    Reads every permission granted to a role through `RolePermission` and
+    combines their bitmasks into one.
+    """
+    from common_app.models import RolePermission
+
+    permission_masks = RolePermission.objects.filter(role_id=role_id).values_list(
+        'permission_id__permission_mask', flat=True
+    )
+
+    mask = 0
+
+    for permission_mask in permission_masks:
+        mask |= permission_mask or 0
+
+    return mask
+
+
+def get_role_permissions(role_id: uuid.UUID) -> int:
+    """
+    Returns the permission bitmask granted to a role.
+
+    Lookups go through two cache tiers before touching the database:
+    - An in-process LRU cache (short TTL, so other workers converge quickly
+      after an invalidation).
+    - A shared Redis key holding the bitmask.
+
+    Redis failures are ignored and fall through to the database.
+
+    Args:
+        role_id (uuid.UUID): The ID of the role whose permissions are requested.
+
+    Returns:
+        int: The permission bitmask (see `common_app.permission_bits`) granted to the role.
+    """
+    key = _redis_key(role_id)
+    permissions = _local_cache.get(key)
+
+    if permissions is not None:
+        return permissions
+
+    try:
+        cached = redis_client.get(key)
+    except redis.RedisError:
+        cached = None
+
+    if cached is not None:
+        permissions = int(cached)
+
+    else:
+        permissions = _load_role_permissions(role_id)
+
+        try:
+            redis_client.setex(key, settings.PERMISSION_CACHE_TTL, permissions)
+        except redis.RedisError:
+            pass
+
+    _local_cache.set(key, permissions)
+    return permissions
+
+
+def invalidate_role_permissions(*role_ids: uuid.UUID):
+    """
+    Drops the cached permissions of the given roles from both cache tiers.
+    """
+    keys = [_redis_key(role_id) for role_id in role_ids if role_id]
+
+    if not keys:
+        return
+
+    for key in keys:
+        _local_cache.delete(key)
+
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError:
+        pass
+
+
+def get_role_name(role_id: uuid.UUID) -> str:
+    """
+    Returns the name of a role, or None if the role does not exist.
+
+    Names are kept in an in-process LRU cache; unknown roles are not cached,
+    so a newly created role is found on the next lookup.
+    """
+    from common_app.models import Role
+
+    key = str(role_id)
+    name = _role_name_cache.get(key)
+
+    if name is None:
+        name = Role.objects.filter(id=role_id).values_list('name', flat=True).first()
+
+        if name is not None:
+            _role_name_cache.set(key, name)
+
+    return name
+
+
+def invalidate_role_name(role_id: uuid.UUID):
+    _role_name_cache.delete(str(role_id))
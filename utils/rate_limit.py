@@ -0,0 +1,160 @@
+import math
+import time
+import uuid
+import redis
+
+from collections import namedtuple
+from django.conf import settings
+from utils.redis_client import redis_client
+
+
+STATS_KEY = 'rate_limit:stats'
+
+RateLimitResult = namedtuple('RateLimitResult', ['allowed', 'remaining', 'retry_after'])
+
+
+# Sliding-window log: one sorted-set member per accepted hit, scored by its time
+# in milliseconds. Hits older than the window are trimmed before counting, and the
+# allowed/blocked counter for the scope is bumped in the same call.
+# Returns {allowed, remaining, retry_after_ms}.
+_sliding_window_script = redis_client.register_script("""
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    redis.call('HINCRBY', KEYS[2], ARGV[5] .. ':allowed', 1)
+    return {1, limit - count - 1, 0}
+end
+
+redis.call('HINCRBY', KEYS[2], ARGV[5] .. ':blocked', 1)
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, 0, tonumber(oldest[2]) + window - now}
+""")
+
+
+# Token bucket stored as a hash of the remaining tokens and the last refill time
+# in milliseconds. Refill, take and the allowed/blocked counter happen in one call.
+# With KEYS[3] and KEYS[4], the bucket KEYS[1] is only used while the key KEYS[3]
+# exists; otherwise the hit goes to the bucket KEYS[4].
+# Returns {allowed, remaining, retry_after_ms}.
+_token_bucket_script = redis_client.register_script("""
+local key = KEYS[1]
+
+if #KEYS == 4 and redis.call('EXISTS', KEYS[3]) == 0 then
+    key = KEYS[4]
+end
+
+local now = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+
+local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local last = tonumber(bucket[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - last) * rate / 1000)
+
+local allowed = 0
+local retry_after = 0
+
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+    redis.call('HINCRBY', KEYS[2], ARGV[4] .. ':allowed', 1)
+else
+    retry_after = math.ceil((1 - tokens) * 1000 / rate)
+    redis.call('HINCRBY', KEYS[2], ARGV[4] .. ':blocked', 1)
+end
+
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', key, math.ceil(capacity * 1000 / rate))
+return {allowed, math.floor(tokens), retry_after}
+""")
+
+
+def check_rate_limit(scope: str, identifier: str) -> RateLimitResult:
+    """
+    Records a hit for `identifier` under a sliding-window limit and tells whether it is allowed.
+
+    Limits are configured per scope in `settings.SLIDING_WINDOW_RATE_LIMITS` as
+    `(max_hits, window_seconds)`. Blocked hits are not recorded, so a client is
+    let through again as soon as its oldest accepted hit leaves the window.
+    If Redis is unavailable the hit is allowed.
+
+    Args:
+        scope (str): The limit to apply, e.g. `'otp_send_phone'`.
+        identifier (str): The subject being limited, e.g. a phone number or IP address.
+
+    Returns:
+        RateLimitResult: `allowed`, the `remaining` hits in the window, and
+            `retry_after` (seconds until the next hit would be allowed).
+    """
+    limit, window = settings.SLIDING_WINDOW_RATE_LIMITS[scope]
+
+    try:
+        allowed, remaining, retry_after_ms = _sliding_window_script(
+            keys=[f"rate_limit:{scope}:{identifier}", STATS_KEY],
+            args=[int(time.time() * 1000), window * 1000, limit, uuid.uuid4().hex, scope]
+        )
+    except redis.RedisError:
+        return RateLimitResult(True, limit, 0)
+
+    return RateLimitResult(bool(allowed), remaining, math.ceil(retry_after_ms / 1000))
+
+
+def take_token(scope: str, identifier: str, rate: float, capacity: int,
+               required_key: str = None, fallback_identifier: str = None) -> RateLimitResult:
+    """
+    Takes one token from the bucket of `identifier` under `scope`.
+
+    The bucket holds up to `capacity` tokens and refills at `rate` tokens per
+    second. If Redis is unavailable the request is allowed.
+
+    When `required_key` and `fallback_identifier` are given, the bucket of
+    `identifier` is only used if `required_key` exists in Redis, otherwise the
+    token is taken from the bucket of `fallback_identifier`. The check happens in
+    the same script call.
+
+    Args:
+        scope (str): The limit being applied, e.g. a view class name.
+        identifier (str): The subject being limited, e.g. `'user:<id>'` or `'ip:<address>'`.
+        rate (float): Tokens added per second.
+        capacity (int): The bucket size, i.e. the allowed burst.
+        required_key (str, optional): A Redis key that must exist to use `identifier`'s bucket.
+        fallback_identifier (str, optional): The subject limited when `required_key` is missing.
+
+    Returns:
+        RateLimitResult: `allowed`, the `remaining` tokens, and `retry_after`
+            (seconds until a token is available).
+    """
+    keys = [f"rate_limit:{scope}:{identifier}", STATS_KEY]
+
+    if required_key and fallback_identifier:
+        keys += [required_key, f"rate_limit:{scope}:{fallback_identifier}"]
+
+    try:
+        allowed, remaining, retry_after_ms = _token_bucket_script(
+            keys=keys,
+            args=[int(time.time() * 1000), rate, capacity, scope]
+        )
+    except redis.RedisError:
+        return RateLimitResult(True, capacity, 0)
+
+    return RateLimitResult(bool(allowed), remaining, math.ceil(retry_after_ms / 1000))
+
+
+def get_rate_limit_stats() -> dict:
+    """
+    Returns the allowed/blocked hit counters of every scope, e.g. `{'otp_send_phone:blocked': 3}`.
+    """
+    try:
+        return {field: int(value) for field, value in redis_client.hgetall(STATS_KEY).items()}
+    except redis.RedisError:
+        return {}
@@ -0,0 +1,16 @@
+import redis
+
+from django.conf import settings
+
+
+# One connection pool per process, shared by every caller of `redis_client`.
+redis_pool = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    health_check_interval=30,
+    decode_responses=True,
+)
+
+redis_client = redis.StrictRedis(connection_pool=redis_pool)
@@ -0,0 +1,152 @@
+import json
+import redis
+import hashlib
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from utils.redis_client import redis_client
+
+
+STATS_KEY = 'response_cache:stats'
+
+
+# Builds the response key from the current versions of the given version keys, reads
+# it and counts the hit or miss, in one round trip. Bumping any version key makes
+# every response built from it unreachable; stale entries simply expire.
+# Returns {response_key, cached_value or nil}.
+_lookup_script = redis_client.register_script("""
+local versions = {}
+for index = 2, #KEYS do
+    versions[#versions + 1] = redis.call('GET', KEYS[index]) or '0'
+end
+
+local key = ARGV[1] .. ':v' .. table.concat(versions, '.')
+local value = redis.call('GET', key)
+
+if value then
+    redis.call('HINCRBY', KEYS[1], ARGV[2] .. ':hits', 1)
+else
+    redis.call('HINCRBY', KEYS[1], ARGV[2] .. ':misses', 1)
+end
+
+return {key, value}
+""")
+
+
+def package_version_key(package_id) -> str:
+    return f"response_cache:version:tour_package:{package_id}"
+
+
+def user_packages_version_key(user_id) -> str:
+    return f"response_cache:version:user_packages:{user_id}"
+
+
+def package_itineraries_version_key(package_id) -> str:
+    return f"response_cache:version:package_itineraries:{package_id}"
+
+
+def itinerary_version_key(itinerary_id) -> str:
+    return f"response_cache:version:itinerary:{itinerary_id}"
+
+
+def get_cached_response(request, scope: str, *version_keys: str):
+    """
+    Looks up the cached response of a GET request.
+
+    The cache key is made of the scope, the request path and query string and the
+    current value of each version key, so a response is served only while none of
+    the data it was built from has changed (see `bump_versions`).
+
+    Args:
+        request (Request): The incoming GET request.
+        scope (str): The kind of response, e.g. `'tour_package'`; also the metrics label.
+        *version_keys (str): The version keys the response depends on.
+
+    Returns:
+        tuple:
+            - (HttpResponse or None): The cached response (or a 304 if the client's
+                validators match), or None on a miss.
+            - (str or None): The key to store the response under with `cache_response`,
+                or None if Redis is unavailable.
+    """
+    path_digest = hashlib.sha256(request.get_full_path().encode()).hexdigest()[:32]
+
+    try:
+        cache_key, cached = _lookup_script(
+            keys=[STATS_KEY, *version_keys],
+            args=[f"response_cache:{scope}:{path_digest}", scope]
+        )
+    except redis.RedisError:
+        return None, None
+
+    if cached is None:
+        return None, cache_key
+
+    cached = json.loads(cached)
+    not_modified = get_conditional_response(
+        request,
+        etag=cached['etag'],
+        last_modified=cached['last_modified_ts']
+    )
+
+    if not_modified:
+        return not_modified, cache_key
+
+    response = HttpResponse(cached['body'], content_type='application/json', status=200)
+
+    if cached['etag']:
+        response['ETag'] = cached['etag']
+
+    if cached['last_modified']:
+        response['Last-Modified'] = cached['last_modified']
+
+    return response, cache_key
+
+
+def cache_response(cache_key: str, response, last_modified_ts: int = None):
+    """
+    Stores a successful response for `settings.RESPONSE_CACHE_TTL` seconds and returns it.
+    """
+    if not cache_key or response.status_code != 200 or response.streaming:
+        return response
+
+    value = json.dumps({
+        'body': response.content.decode(),
+        'etag': response.get('ETag'),
+        'last_modified': response.get('Last-Modified'),
+        'last_modified_ts': last_modified_ts,
+    })
+
+    try:
+        redis_client.setex(cache_key, settings.RESPONSE_CACHE_TTL, value)
+    except redis.RedisError:
+        pass
+
+    return response
+
+
+def bump_versions(*version_keys: str):
+    """
+    Invalidates every cached response depending on one of the given version keys.
+    """
+    try:
+        pipeline = redis_client.pipeline(transaction=False)
+
+        for key in version_keys:
+            pipeline.incr(key)
+            pipeline.expire(key, settings.RESPONSE_CACHE_VERSION_TTL)
+
+        pipeline.execute()
+    except redis.RedisError:
+        pass
+
+
+def get_response_cache_stats() -> dict:
+    """
+    Returns the hit/miss counters per scope, e.g. `{'tour_package:hits': 10}`.
+    """
+    try:
+        return {field: int(value) for field, value in redis_client.hgetall(STATS_KEY).items()}
+    except redis.RedisError:
+        return {}
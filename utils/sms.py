@@ -0,0 +1,161 @@
+import json
+import time
+import redis
+import logging
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from utils.redis_client import redis_client
+
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = 'sms:queue'
+FAILED_KEY = 'sms:failed'
+FAKE_OUTBOX_KEY = 'sms:fake_outbox'
+
+
+class TwilioBackend:
+    """
+    Sends messages through Twilio.
+
+    The client and its HTTP session are created once per backend, so a worker
+    reuses pooled keep-alive connections instead of a new TLS handshake per message.
+    """
+
+    def __init__(self):
+        from twilio.rest import Client
+        from twilio.http.http_client import TwilioHttpClient
+
+        self.client = Client(
+            settings.TWILIO_SID,
+            settings.TWILIO_TOKEN,
+            http_client=TwilioHttpClient(pool_connections=True, timeout=10)
+        )
+
+
+    def send(self, to: str, body: str):
+        self.client.messages.create(to=to, from_=settings.TWILIO_FROM_NUMBER, body=body)
+
+
+
+class FakeBackend:
+    """
+    Local stand-in for an SMS gateway, used for development and load tests.
+
+    Messages are appended to a capped Redis list (`sms:fake_outbox`) after an
+    optional delay of `SMS_FAKE_LATENCY` seconds that simulates the provider.
+    """
+
+    outbox_size = 1000
+
+    def send(self, to: str, body: str):
+        if settings.SMS_FAKE_LATENCY:
+            time.sleep(settings.SMS_FAKE_LATENCY)
+
+        pipeline = redis_client.pipeline()
+        pipeline.lpush(FAKE_OUTBOX_KEY, json.dumps({'to': to, 'body': body, 'sent_at': time.time()}))
+        pipeline.ltrim(FAKE_OUTBOX_KEY, 0, self.outbox_size - 1)
+        pipeline.execute()
+
+
+
+def get_backend():
+    """
+    Instantiates the backend configured in `settings.SMS_BACKEND`.
+    """
+    return import_string(settings.SMS_BACKEND)()
+
+
+def enqueue_sms(to: str, body: str, expires_in: int = None) -> bool:
+    """
+    Queues a message for the SMS worker (`manage.py sms_worker`).
+
+    Args:
+        to (str): The recipient's phone number, with country code.
+        body (str): The message text.
+        expires_in (int, optional): Seconds after which the message is no longer worth
+            sending (e.g. the OTP lifetime); the worker drops it after that.
+
+    Returns:
+        bool: True if the message was queued, False if Redis is unavailable.
+    """
+    now = time.time()
+    message = {'to': to, 'body': body, 'queued_at': now}
+
+    if expires_in:
+        message['expires_at'] = now + expires_in
+
+    try:
+        redis_client.rpush(QUEUE_KEY, json.dumps(message))
+        return True
+    except redis.RedisError:
+        logger.exception('Could not queue SMS')
+        return False
+
+
+def parse_message(raw: str):
+    """
+    Decodes a queued message, or returns None if it is malformed.
+    """
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return None
+
+    if not isinstance(message, dict) or not message.get('to') or not message.get('body'):
+        return None
+
+    return message
+
+
+def is_expired(message: dict) -> bool:
+    return bool(message.get('expires_at')) and message['expires_at'] <= time.time()
+
+
+def deliver(backend, message: dict, max_retries: int) -> bool:
+    """
+    Sends a queued message, retrying with exponential backoff.
+
+    Expired messages (e.g. OTPs past their lifetime) are dropped, before the first
+    attempt or between retries. Messages that still fail after `max_retries`
+    retries are moved to the `sms:failed` list for inspection.
+
+    Returns:
+        bool: True if the message was sent.
+    """
+    for attempt in range(max_retries + 1):
+        if is_expired(message):
+            logger.info('Dropped expired SMS to %s', message['to'])
+            return False
+
+        try:
+            backend.send(message['to'], message['body'])
+            return True
+        except Exception:
+            logger.warning('SMS to %s failed (attempt %s)', message['to'], attempt + 1, exc_info=True)
+
+            if attempt < max_retries:
+                time.sleep(min(2 ** attempt, 30))
+
+    move_to_failed(message)
+    return False
+
+
+def move_to_failed(message: dict):
+    """
+    Records a message that could not be sent in the `sms:failed` list for inspection.
+
+    The body is left out, since it may hold an OTP. The list keeps the latest
+    `SMS_FAILED_SIZE` entries and expires `SMS_FAILED_TTL` seconds after the last one.
+    """
+    entry = {'to': message.get('to'), 'queued_at': message.get('queued_at'), 'failed_at': time.time()}
+
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.lpush(FAILED_KEY, json.dumps(entry))
+        pipeline.ltrim(FAILED_KEY, 0, settings.SMS_FAILED_SIZE - 1)
+        pipeline.expire(FAILED_KEY, settings.SMS_FAILED_TTL)
+        pipeline.execute()
+    except redis.RedisError:
+        logger.error('Could not store failed SMS to %s', message.get('to'))
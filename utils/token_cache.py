@@ -0,0 +1,76 @@
+import json
+import time
+import redis
+import hashlib
+
+from utils.redis_client import redis_client
+
+
+def token_cache_key(access_token: str) -> str:
+    """
+    Builds the cache key for a token. Only a digest of the token is stored in Redis.
+    """
+    return f"access_token:{hashlib.sha256(access_token.encode()).hexdigest()}"
+
+
+def cache_token(access_token: str, user_id, role_id, role: str, expires_at) -> None:
+    """
+    Stores the identity behind an access token until the token expires.
+
+    Args:
+        access_token (str): The bearer token value.
+        user_id (uuid.UUID): The ID of the token owner.
+        role_id (uuid.UUID): The ID of the owner's role.
+        role (str): The name of the owner's role.
+        expires_at (datetime): The expiry of the token; also used as the cache TTL.
+    """
+    ttl = int(expires_at.timestamp() - time.time())
+
+    if ttl <= 0:
+        return
+
+    payload = json.dumps({
+        'user_id': str(user_id),
+        'role_id': str(role_id),
+        'role': role,
+        'expires_at': expires_at.timestamp(),
+    })
+
+    try:
+        redis_client.setex(token_cache_key(access_token), ttl, payload)
+    except redis.RedisError:
+        pass
+
+
+def get_cached_token(access_token: str):
+    """
+    Returns the cached identity of an access token.
+
+    Returns:
+        dict or None: A dict with `user_id`, `role_id`, `role` and `expires_at`
+            (a POSIX timestamp), or None on a cache miss or Redis failure.
+    """
+    try:
+        payload = redis_client.get(token_cache_key(access_token))
+    except redis.RedisError:
+        return None
+
+    if payload is None:
+        return None
+
+    return json.loads(payload)
+
+
+def evict_token(*access_tokens: str) -> None:
+    """
+    Removes the given access tokens from the cache, e.g. after they were rotated.
+    """
+    keys = [token_cache_key(token) for token in access_tokens if token]
+
+    if not keys:
+        return
+
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError:
+        pass
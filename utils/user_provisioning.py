@@ -0,0 +1,183 @@
+from itertools import islice
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from common_app.models import Role, User
+from authentication.hashing import PasswordHashingBusy, hash_passwords
+from users.serializer.register_serializer import UserRegistrationSerializer
+from utils.effective_permissions import refresh_user_permissions
+from utils.bloom_filter import remember_user_contacts
+
+
+UNIQUE_FIELDS = {
+    'email': 'User with this email already exists',
+    'phone_no': 'User with this phone number already exists',
+}
+
+BUSY_ERROR = {'row': ['Server is busy, please try again.']}
+
+
+def provision_users(creator_id, rows, chunk_size: int = None) -> dict:
+    """
+    Validates and creates users chunk by chunk, on behalf of `creator_id`.
+
+    Each chunk is validated with `UserRegistrationSerializer`, its emails and phone
+    numbers are checked against the existing users with one query and its roles with
+    another, the passwords of the valid rows are hashed in parallel on the password
+    hashing pool, and the users are inserted with one `bulk_create`. Rows repeating
+    an email or phone number of an earlier row are rejected too. Valid rows are kept
+    even when other rows fail; every failure is reported with its row number.
+
+    If the password hashing pool stays saturated, the chunks already inserted are
+    kept and the rows of the current chunk and of every later one are reported as
+    failed with a busy error, so the caller can retry just those rows.
+
+    Args:
+        creator_id (uuid.UUID): The user recorded as `created_by` of the new users.
+        rows (iterable): `(row_number, row)` pairs, e.g. from `utils.bulk_import.iter_rows`.
+        chunk_size (int, optional): Rows per chunk, defaults to `settings.IMPORT_CHUNK_SIZE`.
+
+    Returns:
+        dict: `{'created': int, 'failed': int, 'errors': [{'row': int, 'errors': dict}]}`.
+    """
+    chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+    rows = iter(rows)
+    seen = {field: set() for field in UNIQUE_FIELDS}
+    report = {'created': 0, 'failed': 0, 'errors': []}
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+
+        if not chunk:
+            break
+
+        valid, errors = _validate_chunk(chunk, seen)
+
+        try:
+            created, insert_errors = _insert_chunk(creator_id, valid)
+        except PasswordHashingBusy:
+            created = 0
+            insert_errors = [{'row': row_number, 'errors': BUSY_ERROR} for row_number, _ in valid]
+            insert_errors.extend({'row': row_number, 'errors': BUSY_ERROR} for row_number, _ in rows)
+
+        errors.extend(insert_errors)
+        errors.sort(key=lambda error: error['row'])
+
+        report['created'] += created
+        report['failed'] += len(errors)
+        report['errors'].extend(errors)
+
+    return report
+
+
+def _validate_chunk(chunk: list, seen: dict):
+    """
+    Returns the `(row_number, validated_data)` pairs of the rows that can be inserted
+    and the errors of the others. `seen` holds the emails and phone numbers accepted so far.
+    """
+    valid, errors = [], []
+
+    for row_number, row in chunk:
+        if row is None:
+            errors.append({'row': row_number, 'errors': {'row': ['Row must be a JSON object.']}})
+            continue
+
+        serializer = UserRegistrationSerializer(data=row)
+
+        if not serializer.is_valid():
+            errors.append({'row': row_number, 'errors': serializer.errors})
+            continue
+
+        data = dict(serializer.validated_data)
+        duplicates = {
+            field: [f'Duplicate {field} in the import.']
+            for field in UNIQUE_FIELDS if data[field] in seen[field]
+        }
+
+        if duplicates:
+            errors.append({'row': row_number, 'errors': duplicates})
+            continue
+
+        for field in UNIQUE_FIELDS:
+            seen[field].add(data[field])
+
+        valid.append((row_number, data))
+
+    if not valid:
+        return valid, errors
+
+    existing = User.objects.filter(
+        Q(email__in=[data['email'] for _, data in valid]) |
+        Q(phone_no__in=[data['phone_no'] for _, data in valid])
+    ).values_list(*UNIQUE_FIELDS)
+
+    taken = {field: set() for field in UNIQUE_FIELDS}
+
+    for values in existing:
+        for field, value in zip(UNIQUE_FIELDS, values):
+            taken[field].add(value)
+
+    role_ids = set(Role.objects.filter(id__in={data['role_id'] for _, data in valid}).values_list('id', flat=True))
+    insertable = []
+
+    for row_number, data in valid:
+        row_errors = {
+            field: [message]
+            for field, message in UNIQUE_FIELDS.items() if data[field] in taken[field]
+        }
+
+        if data['role_id'] not in role_ids:
+            row_errors['role_id'] = ['In-valid role.']
+
+        if row_errors:
+            errors.append({'row': row_number, 'errors': row_errors})
+        else:
+            insertable.append((row_number, data))
+
+    return insertable, errors
+
+
+def _insert_chunk(creator_id, valid: list):
+    """
+    Hashes the passwords of the validated rows of a chunk and inserts them with one `bulk_create`.
+
+    `bulk_create` sends no `post_save` signals, so once the transaction commits the
+    new users are added to the user Bloom filter and their effective permissions
+    are computed here. If a concurrent writer took one of the emails or phone
+    numbers since the chunk was checked, the chunk is retried row by row so only
+    the conflicting rows fail.
+
+    Returns:
+        tuple: The number of created users and the errors of the rows that failed.
+    """
+    if not valid:
+        return 0, []
+
+    passwords = hash_passwords([data['password'] for _, data in valid])
+    users = []
+
+    for (row_number, data), password in zip(valid, passwords):
+        fields = {**data, 'password': password, 'role_id_id': data['role_id'], 'created_by_id': creator_id}
+        del fields['role_id']
+        users.append((row_number, User(**fields)))
+
+    try:
+        with transaction.atomic():
+            created_users = User.objects.bulk_create([user for _, user in users])
+            user_ids = [user.id for user in created_users]
+            transaction.on_commit(lambda: remember_user_contacts(*created_users))
+            transaction.on_commit(lambda: refresh_user_permissions(*user_ids))
+        return len(users), []
+
+    except IntegrityError:
+        created, errors = 0, []
+
+        for row_number, user in users:
+            try:
+                with transaction.atomic():
+                    user.save(force_insert=True)
+                created += 1
+            except IntegrityError:
+                errors.append({'row': row_number, 'errors': {'row': ['User already exists.']}})
+
+        return created, errors
@@ -1,39 +1,56 @@
 import os
 import uuid
-import redis
-import pyotp
+import hashlib
 import secrets
 import datetime
 
 from functools import wraps
 from datetime import datetime
 from dotenv import load_dotenv
-from twilio.rest import Client
 from datetime import timedelta
 from common_app.models import *
 from django.conf import settings
-from django.http import JsonResponse
-from django.http import JsonResponse
-from twilio.base.exceptions import TwilioRestException
+from django.utils import timezone
+from django.db import IntegrityError, transaction
+from django.utils.http import http_date, quote_etag
+from django.utils.cache import get_conditional_response
+from django.db.models import Count, Max
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
+from utils.redis_client import redis_client
+from authentication.hashing import PasswordHashingBusy
+from utils.effective_permissions import get_effective_permissions
+from common_app.permission_bits import has_permission
+from utils.sms import enqueue_sms
+from utils.json_renderer import render_json
+from utils.pagination import InvalidCursor, is_paginated, paginate
+from utils.rate_limit import check_rate_limit
+from utils.db import get_violated_field
+from utils.bloom_filter import email_may_exist, phone_no_may_exist
+from utils.permission_cache import get_role_name
+from utils.token_cache import cache_token, evict_token
+from utils.jwt_tokens import IssuedToken, issue_access_token, revoke_access_token
 from common_app.models import OAuthAccessToken, OAuthApplication
 
 
 load_dotenv()
 
-redis_client = redis.StrictRedis(host='localhost', port=6379, db=0, decode_responses=True)
-
 def create_response(success: bool = None, message: str = None, data: JsonResponse = None, 
-                    status: int = None) -> JsonResponse:
+                    status: int = None, meta: dict = None) -> HttpResponse:
     """
-    Generates a JsonResponse with the given success flag, message, and HTTP status code.
+    Generates a JSON response with the given success flag, message, and HTTP status code.
+
+    The payload is encoded directly to bytes by the renderer selected in
+    `settings.JSON_RENDERER` (see `utils.json_renderer`), which handles UUIDs,
+    Decimals and datetimes from `.values()` rows without copying them.
 
     Args:
         success (bool): A flag indicating whether the request was successful or not.
         message (str): A message to be included in the response.
         status (int): The HTTP status code to be returned with the response.
+        meta (dict, optional): Response metadata such as the pagination cursor.
 
     Returns:
-        JsonResponse: A JsonResponse object containing the success flag, message, and status code.
+        HttpResponse: A JSON response containing the success flag, message, and status code.
     """
 
     response_data = {
@@ -42,13 +59,249 @@ def create_response(success: bool = None, message: str = None, data: JsonRespons
     }
     if data:
         response_data["data"] = data
+    if meta:
+        response_data["meta"] = meta
 
-    return JsonResponse(
-        response_data, 
+    return HttpResponse(
+        render_json(response_data), 
+        content_type='application/json',
         status=status
     )
 
 
+def create_streaming_response(request, message: str, queryset) -> StreamingHttpResponse:
+    """
+    Streams the rows of a `.values()` queryset instead of building the whole response in memory.
+
+    Rows are read with `QuerySet.iterator()` (a server-side cursor on PostgreSQL) in chunks
+    of `settings.STREAMING_CHUNK_SIZE` and encoded chunk by chunk, so memory use does not
+    grow with the table size.
+
+    The body has the same shape as `create_response` (`{"success": true, "message": ...,
+    "data": [...]}`). Clients passing `?output=ndjson` get newline-delimited JSON
+    instead, one row per line. (`format` and the `Accept` header are left to DRF's
+    content negotiation.)
+
+    Args:
+        request (Request): The incoming request, used to pick the output format.
+        message (str): A message to be included in the response.
+        queryset (QuerySet): The `.values()` queryset to stream.
+
+    Returns:
+        StreamingHttpResponse: A 200 response streaming the rows.
+    """
+    chunk_size = settings.STREAMING_CHUNK_SIZE
+    ndjson = request.GET.get('output') == 'ndjson'
+
+    def chunks():
+        chunk = []
+
+        for row in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(row)
+
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def ndjson_body():
+        for chunk in chunks():
+            yield b''.join(render_json(row) + b'\n' for row in chunk)
+
+    def json_body():
+        yield render_json({"success": True, "message": message})[:-1] + b',"data":['
+        separator = b''
+
+        for chunk in chunks():
+            # Encode the chunk as one array and drop its brackets to splice it in.
+            yield separator + render_json(chunk)[1:-1]
+            separator = b','
+
+        yield b']}'
+
+    if ndjson:
+        return StreamingHttpResponse(ndjson_body(), content_type='application/x-ndjson', status=200)
+
+    return StreamingHttpResponse(json_body(), content_type='application/json', status=200)
+
+
+def create_list_response(request, message: str, queryset, stream: bool = False, 
+                         transform=None) -> HttpResponse:
+    """
+    Returns the rows of a `.values()` queryset, one page at a time if the client asks for it.
+
+    With a `cursor` or `page_size` query parameter the response holds a single page
+    (see `utils.pagination.paginate`) and `meta.next_cursor` points to the next one.
+    Otherwise the full list is returned as before, streamed if `stream` is set.
+
+    Args:
+        request (Request): The incoming request.
+        message (str): A message to be included in the response.
+        queryset (QuerySet): The filtered `.values()` queryset.
+        stream (bool): Whether to stream the full list (see `create_streaming_response`).
+        transform (callable, optional): Applied to each row before it is returned; not
+            supported together with `stream`.
+
+    Returns:
+        HttpResponse: A 200 response with the rows, or a 400 response for an invalid cursor.
+    """
+    if not is_paginated(request):
+        if stream:
+            return create_streaming_response(request, message=message, queryset=queryset)
+
+        rows = list(queryset)
+        meta = None
+
+    else:
+        try:
+            rows, next_cursor = paginate(request, queryset)
+        except InvalidCursor as e:
+            return create_response(success=False, message=str(e), status=400)
+
+        meta = {'next_cursor': next_cursor, 'page_size': len(rows)}
+
+    if transform:
+        rows = [transform(row) for row in rows]
+
+    return create_response(success=True, message=message, data=rows, status=200, meta=meta)
+
+
+def get_sparse_fields(request, model):
+    """
+    Reads the `fields` query parameter (e.g. `?fields=id,package_name,base_price`).
+
+    The requested names are validated against the model's `API_FIELDS` whitelist and
+    are meant to be passed to `.values(*fields)`, so only those columns are selected.
+
+    Args:
+        request (Request): The incoming request.
+        model (Model): The model being listed; must define `API_FIELDS`.
+
+    Returns:
+        tuple:
+            - (list): The requested field names, or an empty list for all fields.
+            - (str or None): An error message if a requested field is not allowed.
+    """
+    requested = request.GET.get('fields')
+
+    if not requested:
+        return [], None
+
+    fields = list(dict.fromkeys(field.strip() for field in requested.split(',') if field.strip()))
+    invalid = [field for field in fields if field not in model.API_FIELDS]
+
+    if invalid:
+        return [], f"Invalid fields: {', '.join(invalid)}."
+
+    return fields, None
+
+
+def get_validator(request, queryset, many: bool = False) -> dict:
+    """
+    Computes the cache validators of a GET response over `queryset` with one aggregate query.
+
+    The ETag is derived from the request path and query string (so `fields`, `cursor`
+    etc. get their own tag), the row count and `Max(updated_at)`: any insert, update or
+    delete of a matching row changes it.
+
+    List responses get no `last_modified`: `Max(updated_at)`, in whole seconds, stays
+    the same when a row other than the newest is deleted or when a row is edited twice
+    within a second, so `If-Modified-Since` would answer 304 for a changed list.
+
+    Args:
+        request (Request): The incoming GET request.
+        queryset (QuerySet): The rows the response is built from.
+        many (bool, optional): Whether the response is a list of `queryset`'s rows.
+
+    Returns:
+        dict: `count`, `etag` and `last_modified` (a POSIX timestamp, or None if no rows
+        or `many`).
+    """
+    stats = queryset.aggregate(count=Count('id'), last_modified=Max('updated_at'))
+    last_modified = stats['last_modified']
+    version = f"{request.get_full_path()}|{stats['count']}|{last_modified.isoformat() if last_modified else ''}"
+
+    return {
+        'count': stats['count'],
+        'etag': quote_etag(hashlib.sha256(version.encode()).hexdigest()[:32]),
+        'last_modified': int(last_modified.timestamp()) if last_modified and not many else None,
+    }
+
+
+def not_modified_response(request, validator: dict):
+    """
+    Returns a 304 Not Modified response if the client's `If-None-Match` (or
+    `If-Modified-Since`) matches the validator, otherwise None.
+    """
+    return get_conditional_response(
+        request,
+        etag=validator['etag'],
+        last_modified=validator['last_modified']
+    )
+
+
+def set_validator_headers(response, validator: dict):
+    """
+    Adds the `ETag` and `Last-Modified` headers of a validator to a successful response.
+    """
+    if response.status_code == 200:
+        response['ETag'] = validator['etag']
+
+        if validator['last_modified']:
+            response['Last-Modified'] = http_date(validator['last_modified'])
+
+    return response
+
+
+def get_client_ip(request) -> str:
+    """
+    Returns the IP address of the client that sent the request.
+
+    `X-Forwarded-For` is only honoured when `settings.TRUST_X_FORWARDED_FOR` is enabled,
+    i.e. when the app runs behind a proxy that sets it.
+    """
+    if settings.TRUST_X_FORWARDED_FOR:
+        forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+
+        if forwarded_for:
+            return forwarded_for.split(',')[0].strip()
+
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def enforce_rate_limits(*limits) -> JsonResponse:
+    """
+    Applies sliding-window rate limits and builds the rejection response if one is exceeded.
+
+    Args:
+        *limits (tuple): `(scope, identifier)` pairs, see `utils.rate_limit.check_rate_limit`.
+
+    Returns:
+        JsonResponse or None: A 429 response with a `Retry-After` header if any limit
+            is exceeded, otherwise None.
+    """
+    retry_after = 0
+
+    for scope, identifier in limits:
+        result = check_rate_limit(scope, identifier)
+
+        if not result.allowed:
+            retry_after = max(retry_after, result.retry_after)
+
+    if not retry_after:
+        return None
+
+    response = create_response(
+        success=False,
+        message='Too many attempts, please try again later.',
+        status=429
+    )
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
 def save_image(uploaded_image, user_id: uuid.UUID, role: str):
     """
     Saves the uploaded profile image to the server in a role-specific directory and 
@@ -99,63 +352,123 @@ def create_user(validated_data, profile_image=None, user_id=None):
     """
     Handles user creation with validation, role assignment, and optional profile image processing.
 
+    The user is written with a single INSERT: the ID is generated up front so the
+    profile image can be saved first, the role name comes from the role cache, and
+    duplicate emails and phone numbers are caught by the unique constraints instead
+    of being looked up beforehand.
+
     Args:
         validated_data (dict): The validated data for creating the user, including phone_no, email, and role_id.
         profile_image (InMemoryUploadedFile, optional): The uploaded profile image file for the user. Defaults to None.
+        user_id (uuid.UUID, optional): The ID of the user creating this user, stored as `created_by`.
 
     Returns:
         Response: A JSON response with a status code and message.
         - HTTP 201: User successfully created.
-        - HTTP 409: Duplicate username, email, or phone number.
+        - HTTP 400: Duplicate email or phone number.
+        - HTTP 404: Invalid role or creator.
         - HTTP 500: Internal server error.
+        - HTTP 503: Password hashing pool is saturated.
     """
+    profile_url = None
+
     try:
-        response = is_record_exists(
-            phone_no=validated_data['phone_no'],
-            email=validated_data['email']
-        )
-        
-        if response:
-            return response
+        fields = dict(validated_data)
+        role_id = fields.pop('role_id', None)
+        role_name = get_role_name(role_id) if role_id else None
 
-        role_id = validated_data.get('role_id')
-        role = Role.objects.filter(id=role_id).first()
-        
-        if not role:
+        if not role_name:
             return create_response(
                 success=False,
                 message='In-valid role.',
                 status=404
             )
-        
-        validated_data['role_id'] = role
-        validated_data['created_by'] = get_user_by_id(user_id=user_id)
 
-        user = User.objects.create(**validated_data)
+        user = User(**fields, role_id_id=role_id, created_by_id=user_id)
 
         if profile_image:
             profile_url = save_image(
                 uploaded_image=profile_image,
                 user_id=user.id,
-                role=role.name
+                role=role_name
             )
+            user.profile_url = profile_url
 
-            if profile_url:
-                user.profile_url = profile_url
-        user.save()
+        with transaction.atomic():
+            user.save(force_insert=True)
 
         return create_response(
             success=True,
             message="Register successfully.",
             status=201
         )
-    
+
+    except IntegrityError as error:
+        remove_profile_image(profile_url)
+        field = get_violated_field(error, ('email', 'phone_no', 'role_id', 'created_by'))
+
+        if field == 'email':
+            return create_response(
+                success=False, 
+                message="User with this email already exists", 
+                status=400
+            )
+
+        if field == 'phone_no':
+            return create_response(
+                success=False, 
+                message="User with this phone number already exists", 
+                status=400
+            )
+
+        if field == 'role_id':
+            return create_response(
+                success=False,
+                message='In-valid role.',
+                status=404
+            )
+
+        if field == 'created_by':
+            return create_response(
+                success=False,
+                message='Creator not found.',
+                status=404
+            )
+
+        return create_response(
+            success=False,
+            message="Something went wrong.",
+            status=500
+        )
+
+    except PasswordHashingBusy:
+        remove_profile_image(profile_url)
+        return create_response(
+            success=False,
+            message="Server is busy, please try again.",
+            status=503
+        )
+
     except Exception as e:
+        remove_profile_image(profile_url)
         return create_response(
             success=False,
             message="Something went wrong.",
             status=500
         )
+
+
+def remove_profile_image(profile_url: str):
+    """
+    Deletes the file behind a profile image URL returned by `save_image`, if any.
+    """
+    if not profile_url:
+        return
+
+    image_path = os.path.join(settings.BASE_DIR, 'media', profile_url.replace(settings.MEDIA_URL, '').lstrip('/'))
+
+    if os.path.exists(image_path):
+        os.remove(image_path)
     
 
 def update_user_profile_image(user: User, profile_image) -> str:
@@ -198,9 +511,15 @@ def is_email_exist(email: str):
     Args:
         email (str): The email address to check for existence.
 
+    Emails the user Bloom filter has never seen are reported as free without
+    querying the database.
+
     Returns:
         bool: True if the email exists, False otherwise.
     """
+    if not email_may_exist(email):
+        return False
+
     return User.objects.filter(email=email).exists()
 
 
@@ -211,9 +530,15 @@ def is_phone_number_exist(phone_no: str, country_code: str=None):
     Args:
         phone_no (str): The phone number to check for existence.
 
+    Phone numbers the user Bloom filter has never seen are reported as free without
+    querying the database.
+
     Returns:
         bool: True if the phone number exists, False otherwise.
     """
+    if not phone_no_may_exist(phone_no):
+        return None
+
     if country_code:
         return User.objects.filter(phone_no=phone_no, country_code=country_code).first()
     return User.objects.filter(phone_no=phone_no).first()
@@ -271,58 +596,179 @@ def is_record_exists(username: str = None, email: str = None, phone_no: str = No
 
 def generate_token(user):
     """
-    Generates a secure access token for the authenticated user and stores it in the database.
+    Generates a secure access token and refresh token for the authenticated user and stores
+    them in the database.
 
-    This function creates a new access token for the provided user. It performs the following:
-    - Generates a random access token using the `secrets.token_hex` method.
-    - Sets an expiration time for the token, which is one hour from the current time.
-    - Retrieves client details associated with the OAuth application.
-    - Creates or updates an OAuth access token record for the user in the database, 
-        ensuring that the token is securely stored.
+    The kind of access token depends on `settings.TOKEN_MODE`:
+    - `'opaque'`: a random access token generated with `secrets.token_hex`, valid for one
+        hour. The token itself is stored in the database and cached in Redis.
+    - `'jwt'`: a short-lived signed JWT carrying the user ID, role and effective permission
+        bitmask, which is verified without any lookup. Only its token ID is stored; the
+        access token replaced by this login is revoked.
+
+    In both modes an OAuth access token record is created or updated for the user and
+    the OAuth application, so each user has a single active token per client.
 
     Args:
         user (User): The user object for whom the access token is being generated. 
             This user must be authenticated.
 
     Returns:
-        OAuthAccessToken: The generated or updated OAuth access token object, which contains:
+        IssuedToken: The issued token, which contains:
             - The access token value (`access_token`).
-            - The expiration date and time (`expires_at`).
+            - The refresh token value (`refresh_token`).
+            - The expiration date and time of the access token (`expires_at`).
             - The type of token, which is always set to `'Bearer'` (`token_type`).
     """
     try:
-        access_token = secrets.token_hex(32)
-        expires_at = datetime.now() + timedelta(hours=1)
         client_details = OAuthApplication.objects.get(id=1)
 
-        token, _ = OAuthAccessToken.objects.update_or_create(
+        previous_token = OAuthAccessToken.objects.filter(
+            user=user, client=client_details
+        ).values_list('access_token', 'token_type').first()
+
+        issued_token, token_fields = _issue_token(user)
+
+        OAuthAccessToken.objects.update_or_create(
             user=user,
             client=client_details,
-            defaults={
-                'access_token': access_token,
-                'expires_at': expires_at,
-                'token_type': 'Bearer',
-            }
+            defaults=token_fields
         )
-        return token
+
+        _discard_token(previous_token)
+        _cache_issued_token(user, issued_token, token_fields)
+        return issued_token
     
     except OAuthApplication.DoesNotExist:
         return None
     
     except Exception:
         return None
-    
+
+
+def refresh_access_token(refresh_token: str):
+    """
+    Rotates the access and refresh tokens of the record holding `refresh_token`.
+
+    The record is found with a single lookup on the unique `refresh_token` index and
+    updated only if it still holds the same refresh token, so a refresh token can be
+    used exactly once.
+
+    Args:
+        refresh_token (str): The refresh token sent by the client.
+
+    Returns:
+        IssuedToken or None: The new tokens, or None if the refresh token is unknown,
+            expired or was already used.
+    """
+    try:
+        token = OAuthAccessToken.objects.select_related('user__role_id').filter(
+            refresh_token=refresh_token
+        ).first()
+
+        if not token or not token.refresh_expires_at or token.refresh_expires_at < timezone.now():
+            return None
+
+        issued_token, token_fields = _issue_token(token.user)
+
+        rotated = OAuthAccessToken.objects.filter(
+            id=token.id, refresh_token=refresh_token
+        ).update(updated_at=timezone.now(), **token_fields)
+
+        if not rotated:
+            return None
+
+        _discard_token((token.access_token, token.token_type))
+        _cache_issued_token(token.user, issued_token, token_fields)
+        return issued_token
+
+    except Exception:
+        return None
+
+
+def _issue_token(user):
+    """
+    Creates a new access token and refresh token for a user in the configured token mode.
+
+    In JWT mode the stored record keeps the token ID (`jti`) in `access_token` and is
+    marked with the `'JWT'` token type, so it can never be used as an opaque bearer token.
+
+    Returns:
+        tuple:
+            - (IssuedToken): The tokens to hand out to the client.
+            - (dict): The `OAuthAccessToken` field values to store.
+    """
+    now = timezone.now()
+    refresh_token = secrets.token_urlsafe(48)
+
+    if settings.TOKEN_MODE == 'jwt':
+        access_token, jti, expires_at = issue_access_token(user)
+        token_fields = {'access_token': jti, 'token_type': 'JWT'}
+    else:
+        access_token = secrets.token_hex(32)
+        expires_at = now + timedelta(hours=1)
+        token_fields = {'access_token': access_token, 'token_type': 'Bearer'}
+
+    token_fields.update({
+        'refresh_token': refresh_token,
+        'refresh_expires_at': now + timedelta(seconds=settings.REFRESH_TOKEN_LIFETIME),
+        'expires_at': expires_at,
+    })
+
+    issued_token = IssuedToken(
+        token_type='Bearer',
+        access_token=access_token,
+        refresh_token=refresh_token,
+        expires_at=expires_at
+    )
+    return issued_token, token_fields
+
+
+def _cache_issued_token(user, issued_token, token_fields):
+    """
+    Caches a newly issued opaque access token. Signed tokens need no cache.
+    """
+    if token_fields['token_type'] != 'Bearer':
+        return
+
+    cache_token(
+        access_token=issued_token.access_token,
+        user_id=user.id,
+        role_id=user.role_id_id,
+        role=user.role_id.name,
+        expires_at=issued_token.expires_at
+    )
+
+
+def _discard_token(previous_token):
+    """
+    Invalidates an access token that was replaced by a new login.
+
+    Args:
+        previous_token (tuple or None): The `(access_token, token_type)` of the replaced record.
+    """
+    if not previous_token:
+        return
+
+    access_token, token_type = previous_token
+
+    if token_type == 'JWT':
+        revoke_access_token(access_token)
+    else:
+        evict_token(access_token)
+
 
 
 def retrieve_user_details(user_id: uuid.UUID = None):
     """
-    Checks if a user with the specified ID exists in the User model.
+    Retrieves the details of a user, or of all users.
 
     Args:
-        user_id (int): The ID of the user to check for existence.
+        user_id (int): The ID of the user to retrieve, or None for all users.
 
     Returns:
-        bool: True if the user exists, False otherwise.
+        dict or QuerySet or None: The user's details, or a lazy `.values()` queryset
+            of all users (to be streamed), or None on error.
     """
     try:
         if user_id is not None:
@@ -337,7 +783,7 @@ def retrieve_user_details(user_id: uuid.UUID = None):
                         'first_name', 'last_name', 'middle_name', 'email'
                         , 'phone_no', 'gender', 'date_of_birth', 'is_active', 'last_login'
                     )
-            return list(data)
+            return data
 
     except Exception:
         return None
@@ -345,13 +791,15 @@ def retrieve_user_details(user_id: uuid.UUID = None):
 
 def fetch_address_details(user_id: uuid.UUID = None, address_id: uuid.UUID = None):
     """
-    Checks if a user with the specified ID exists in the User model.
+    Retrieves an address, the addresses of a user, or all addresses.
 
     Args:
-        user_id (int): The ID of the user to check for existence.
+        user_id (int): The ID of the user whose addresses are retrieved.
+        address_id (int): The ID of the address to retrieve.
 
     Returns:
-        bool: True if the user exists, False otherwise.
+        dict or QuerySet or None: The address, or a lazy `.values()` queryset of the
+            user's addresses or of all addresses, or None on error.
     """
     try:
         if address_id:
@@ -366,14 +814,14 @@ def fetch_address_details(user_id: uuid.UUID = None, address_id: uuid.UUID = Non
                     'id', 'user_id', 'house_no', 'apartment', 'nearest_landmark', 'pin_code', 'user_id', 
                     'street_address', 'city', 'state', 'postal_code', 'country', 'latitude', 'longitude'
                 ).all()
-            return list(data)
+            return data
         
         else:
             data =  User_Address.objects.values(
                     'id', 'user_id', 'house_no', 'apartment', 'nearest_landmark', 'pin_code', 'user_id', 
                     'street_address', 'city', 'state', 'postal_code', 'country', 'latitude', 'longitude'
                 ).all()
-            return list(data)
+            return data
 
     except Exception as e:
         return None
@@ -387,9 +835,9 @@ def get_user_by_id(user_id: uuid.UUID):
         user_id (int): The ID of the user to check for existence.
 
     Returns:
-        bool: True if the user exists, False otherwise.
+        User or None: The user with its role already joined, or None if not found.
     """
-    return User.objects.filter(id=user_id).first()
+    return User.objects.select_related('role_id').filter(id=user_id).first()
 
 
 def get_address_by_id(address_id: uuid.UUID):
@@ -409,31 +857,48 @@ def get_address_by_id(address_id: uuid.UUID):
 def generate_otp(user: uuid.UUID):
     """
     Generate a OTP and store it in Redis.
+
+    The OTP is a 6-digit number drawn from the `secrets` module and expires after
+    `settings.OTP_LIFETIME` seconds.
     
     Args:
-    mobile_number (str): The mobile number of the user requesting the OTP.
+    user (User): The user requesting the OTP.
 
     Returns:
     str: OTP
     """
 
     try:
-        otp = pyotp.TOTP(pyotp.random_base32()).now()
+        otp = f"{secrets.randbelow(1000000):06d}"
         redis_key = f"otp:{user.id}"
-        redis_client.setex(redis_key, 300, otp)
+        redis_client.setex(redis_key, settings.OTP_LIFETIME, otp)
         return otp
     
     except:
         return None
 
 
+# Compares and deletes the stored OTP in one atomic step, so an OTP can be used once.
+# Returns -1 if no OTP is stored, 1 if it matched (and was consumed), 0 otherwise.
+_verify_otp_script = redis_client.register_script("""
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return -1
+end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+return 0
+""")
+
+
 def verify_otp(user_id: uuid.UUID, otp_input: str):
     """
     Verifies the OTP provided by the user.
 
-    This method:
-    - Retrieves and checks the stored OTP from Redis.
-    - Deletes the OTP if verified.
+    This method checks the stored OTP in Redis and deletes it if verified, in a
+    single atomic script call.
 
     Args:
         user_id (uuid.UUID): The user's unique ID.
@@ -444,15 +909,12 @@ def verify_otp(user_id: uuid.UUID, otp_input: str):
             - (bool): True if valid, False if invalid or expired.
             - (str): Message indicating the result (e.g., success or error).
     """
-    redis_key = f"otp:{user_id}"
-    stored_otp = redis_client.get(redis_key)
+    result = _verify_otp_script(keys=[f"otp:{user_id}"], args=[otp_input])
     
-    if stored_otp is None:
+    if result == -1:
         return False, "OTP expired.", 410
     
-    if stored_otp == otp_input:
-        # OTP is valid
-        redis_client.delete(redis_key)
+    if result == 1:
         return True, "OTP verified successfully.", 200
     
     return False, "Invalid OTP.", 409
@@ -461,31 +923,26 @@ def verify_otp(user_id: uuid.UUID, otp_input: str):
 
 def send_otp(country_code: str, phone_no: str, otp: str):
     """
-    Generate a OTP and store it in Redis.
-    
+    Queues an SMS with the OTP for the user's phone number.
+
+    The message is sent asynchronously by the SMS worker (`manage.py sms_worker`)
+    through the backend configured in `settings.SMS_BACKEND`, so the login request
+    does not wait for the SMS provider.
+
     Args:
-    mobile_number (str): The mobile number of the user requesting the OTP.
+        country_code (str): The country code of the phone number.
+        phone_no (str): The phone number of the user requesting the OTP.
+        otp (str): The OTP to send.
 
     Returns:
-    str: OTP
+        str: The OTP if the message was queued, otherwise None.
     """
-    try:
-        account_sid = os.getenv('TWILIO_SID')
-        auth_token = os.getenv('TWILIO_TOKEN')
-
-        client = Client(account_sid, auth_token)
-        client.messages.create(
-            to=f"{country_code}{phone_no}",
-            from_="+1 218 506 1882",
-            body=f"Your OTP for login is {otp}. It is valid for 5 minutes."
-        )
-        return otp
-    
-    except TwilioRestException as e:
-        print(e)
-
-    except:
-        return None
+    queued = enqueue_sms(
+        to=f"{country_code}{phone_no}",
+        body=f"Your OTP for login is {otp}. It is valid for {settings.OTP_LIFETIME // 60} minutes.",
+        expires_in=settings.OTP_LIFETIME
+    )
+    return otp if queued else None
     
 
 def update_record(object, data: dict):
@@ -503,10 +960,10 @@ def update_record(object, data: dict):
             - `True` if all attributes were successfully updated.
             - `False` if an exception occurs during the update process.
     """
-    if data.get('email') and User.objects.filter(email=data['email']).exclude(email=object.email).exists():
+    if data.get('email') and email_may_exist(data['email']) and User.objects.filter(email=data['email']).exclude(email=object.email).exists():
         return False, 'Email is already exist.', 409
     
-    if data.get('phone_no') and User.objects.filter(phone_no=data['phone_no']).exclude(phone_no=object.phone_no).exists():
+    if data.get('phone_no') and phone_no_may_exist(data['phone_no']) and User.objects.filter(phone_no=data['phone_no']).exclude(phone_no=object.phone_no).exists():
         return False, 'Phone number is already exist.', 409
 
     for field, value in data.items():
@@ -519,8 +976,12 @@ def check_permissions(user, permission_type:str):
     """
     Check if a user has the required permission for a specific action.
 
-    This function checks the permissions associated with the user's role 
-    to determine if the user is allowed to perform the specified action.
+    This function checks the user's effective permissions (their role's 
+    permissions plus their active user permission grants) to determine if 
+    the user is allowed to perform the specified action. Effective 
+    permissions are served from the materialized effective permission 
+    cache as a bitmask, so the check is a single AND and does not hit the 
+    database once the cache is warm.
 
     Args:
         user (User): The user object for which the permission is being checked.
@@ -536,9 +997,9 @@ def check_permissions(user, permission_type:str):
         
     try:
 
-        role_permission = Permission.objects.filter(role_id= user.role_id).first()
+        user_permissions = get_effective_permissions(user)
         
-        if permission_type not in role_permission.permission.split(','):
+        if not has_permission(user_permissions, permission_type):
             return create_response(
                 success=False,
                 message='Permission denied!',
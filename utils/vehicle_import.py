@@ -0,0 +1,147 @@
+from itertools import islice
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from travel_agency.models import TransportVehicle
+from travel_agency.serializer.transport_vehicle_serializer import TransportVehicleSerializer
+
+
+UNIQUE_FIELDS = ('registration_number', 'owner_phone_no')
+
+
+def import_transport_vehicles(user_id, rows, chunk_size: int = None) -> dict:
+    """
+    Validates and inserts transport vehicles chunk by chunk.
+
+    Each chunk is validated with `TransportVehicleSerializer`, checked against the
+    existing vehicles for `registration_number`/`owner_phone_no` conflicts with a
+    single query, and the valid rows are inserted with one `bulk_create`. Rows
+    conflicting with an earlier row of the same import are rejected too. Valid rows
+    are kept even when other rows fail; every failure is reported with its row number.
+
+    Args:
+        user_id (uuid.UUID): The owner of the imported vehicles.
+        rows (iterable): `(row_number, row)` pairs, e.g. from `utils.bulk_import.iter_rows`.
+        chunk_size (int, optional): Rows per chunk, defaults to `settings.IMPORT_CHUNK_SIZE`.
+
+    Returns:
+        dict: `{'created': int, 'failed': int, 'errors': [{'row': int, 'errors': dict}]}`.
+    """
+    chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+    rows = iter(rows)
+    seen = {field: set() for field in UNIQUE_FIELDS}
+    report = {'created': 0, 'failed': 0, 'errors': []}
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+
+        if not chunk:
+            break
+
+        valid, errors = _validate_chunk(chunk, seen)
+        created, insert_errors = _insert_chunk(user_id, valid)
+
+        errors.extend(insert_errors)
+        errors.sort(key=lambda error: error['row'])
+
+        report['created'] += created
+        report['failed'] += len(errors)
+        report['errors'].extend(errors)
+
+    return report
+
+
+def _validate_chunk(chunk: list, seen: dict):
+    """
+    Returns the `(row_number, validated_data)` pairs of the rows that can be inserted
+    and the errors of the others. `seen` holds the unique values accepted so far.
+    """
+    valid, errors = [], []
+
+    for row_number, row in chunk:
+        if row is None:
+            errors.append({'row': row_number, 'errors': {'row': ['Row must be a JSON object.']}})
+            continue
+
+        serializer = TransportVehicleSerializer(data=row)
+
+        if not serializer.is_valid():
+            errors.append({'row': row_number, 'errors': serializer.errors})
+            continue
+
+        duplicates = {
+            field: [f'Duplicate {field} in the import.']
+            for field in UNIQUE_FIELDS if serializer.validated_data[field] in seen[field]
+        }
+
+        if duplicates:
+            errors.append({'row': row_number, 'errors': duplicates})
+            continue
+
+        for field in UNIQUE_FIELDS:
+            seen[field].add(serializer.validated_data[field])
+
+        valid.append((row_number, serializer.validated_data))
+
+    if not valid:
+        return valid, errors
+
+    existing = TransportVehicle.objects.filter(
+        Q(registration_number__in=[data['registration_number'] for _, data in valid]) |
+        Q(owner_phone_no__in=[data['owner_phone_no'] for _, data in valid])
+    ).values_list(*UNIQUE_FIELDS)
+
+    taken = {field: set() for field in UNIQUE_FIELDS}
+
+    for values in existing:
+        for field, value in zip(UNIQUE_FIELDS, values):
+            taken[field].add(value)
+
+    insertable = []
+
+    for row_number, data in valid:
+        conflicts = {
+            field: [f'Vehicle with this {field} already exists.']
+            for field in UNIQUE_FIELDS if data[field] in taken[field]
+        }
+
+        if conflicts:
+            errors.append({'row': row_number, 'errors': conflicts})
+        else:
+            insertable.append((row_number, data))
+
+    return insertable, errors
+
+
+def _insert_chunk(user_id, valid: list):
+    """
+    Inserts the validated rows of a chunk with one `bulk_create`.
+
+    If a concurrent writer took one of the unique values since the chunk was
+    checked, the chunk is retried row by row so only the conflicting rows fail.
+
+    Returns:
+        tuple: The number of created vehicles and the errors of the rows that failed.
+    """
+    if not valid:
+        return 0, []
+
+    try:
+        with transaction.atomic():
+            TransportVehicle.objects.bulk_create(
+                [TransportVehicle(user_id_id=user_id, **data) for _, data in valid]
+            )
+        return len(valid), []
+
+    except IntegrityError:
+        created, errors = 0, []
+
+        for row_number, data in valid:
+            try:
+                with transaction.atomic():
+                    TransportVehicle.objects.create(user_id_id=user_id, **data)
+                created += 1
+            except IntegrityError:
+                errors.append({'row': row_number, 'errors': {'row': ['Vehicle already exists.']}})
+
+        return created, errors